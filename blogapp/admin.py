@@ -1,9 +1,26 @@
 from django.contrib import admin
-from .models import User, Post, Like, Category, PriceHistory, Comment, Reply
+from .models import User, Post, Like, Category, PriceHistory, Comment, Reply, QueuedMail
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.forms import UserChangeForm, UserCreationForm
 from django.utils.translation import ugettext_lazy as _
 
+from .pagination import EstimatedCountPaginator
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """行数の多いテーブル用。件数は見積もりを使い、絞り込み前の全件数は数えない"""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # list_select_relatedで読み込むが、一覧には出さない大きな列
+    list_defer = ('post__content',)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.list_defer:
+            queryset = queryset.select_related(
+                *self.list_select_related).defer(*self.list_defer)
+        return queryset
+
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
@@ -15,9 +32,11 @@ class PostAdmin(admin.ModelAdmin):
 
 
 @admin.register(Like)
-class LikeAdmin(admin.ModelAdmin):
+class LikeAdmin(LargeTableAdmin):
     list_display = ('id', 'user', 'post')
     list_display_links = ('post',)
+    list_select_related = ('user', 'post')
+    autocomplete_fields = ('user', 'post')
 
 
 @admin.register(Category)
@@ -27,9 +46,11 @@ class CategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(PriceHistory)
-class PriceHistoryAdmin(admin.ModelAdmin):
+class PriceHistoryAdmin(LargeTableAdmin):
     list_display = ('post', 'user', 'created_at', 'stripe_id')
     list_display_links = ('post',)
+    list_select_related = ('post', 'user')
+    autocomplete_fields = ('post', 'user')
     search_fields = ['post__title']
 
 
@@ -71,10 +92,11 @@ admin.site.register(User, MyUserAdmin)
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(LargeTableAdmin):
     def post_title(self, obj):
         return obj.post.title
 
+    list_select_related = ('post',)
     list_filter = ['created_at']
     list_display = ('id', 'author', 'post_title', 'text', 'useremail', 'mailadress', 'created_at',)
     list_display_links = ('text',)
@@ -90,4 +112,13 @@ class ReplyAdmin(admin.ModelAdmin):
     list_display = ('id', 'author', 'text', 'created_at',)
     list_display_links = ('text',)
     search_fields = ['text']
-    ordering = ('-created_at',)
\ No newline at end of file
+    ordering = ('-created_at',)
+
+
+@admin.register(QueuedMail)
+class QueuedMailAdmin(admin.ModelAdmin):
+    list_filter = ['status']
+    list_display = ('id', 'subject', 'recipients', 'status', 'attempts', 'next_attempt_at', 'sent_at',)
+    list_display_links = ('subject',)
+    search_fields = ['subject', 'recipients']
+    ordering = ('-id',)
\ No newline at end of file
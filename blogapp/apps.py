@@ -6,4 +6,14 @@ class BlogappConfig(AppConfig):
 
     def ready(self):
         # シグナルのロードをする。signals.pyを読み込むだけでOK
-        from . import signals
\ No newline at end of file
+        from . import signals
+
+        # Server-Timingのため、すべてのDB接続のクエリ時間を計る
+        from django.db.backends.signals import connection_created
+        from .timing import install_sql_timer
+        connection_created.connect(install_sql_timer)
+
+        # CKEditorのアップロードを内容のハッシュで保存するバックエンド
+        from ckeditor_uploader.backends import registry
+        from .uploads import ContentAddressedBackend
+        registry.register('content_addressed', ContentAddressedBackend)
\ No newline at end of file
@@ -0,0 +1,75 @@
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+_MISSING = object()
+
+
+class TwoLevelCache(BaseCache):
+    """プロセス内のメモリ(L1)と、ワーカー間で共有するキャッシュ(L2)の2段のキャッシュ
+
+    LOCATIONには共有キャッシュのエイリアスを書く。読み込みはL1にあればL2を見ないので、
+    ヒットしたときはDBやネットワークにアクセスしない。L1の値はLOCAL_TIMEOUT秒で期限が切れて
+    L2から読み直すので、他のワーカーでの書き込みや削除はその秒数のうちに伝わる。
+    書き込みは両方に行い、同じワーカーではすぐに反映される。
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._shared = caches[location]
+        self._local_timeout = params.get('LOCAL_TIMEOUT', 5)
+        self._local = LocMemCache('two-level:{}'.format(location), {
+            'TIMEOUT': self._local_timeout,
+            'OPTIONS': {'MAX_ENTRIES': params.get('LOCAL_MAX_ENTRIES', 1000)},
+        })
+
+    def _local_set(self, key, value, timeout, version):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None or timeout > self._local_timeout:
+            timeout = self._local_timeout
+        self._local.set(key, value, timeout, version=version)
+
+    def get(self, key, default=None, version=None):
+        value = self._local.get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            return value
+        value = self._shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self._local_set(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._shared.set(key, value, timeout, version=version)
+        self._local_set(key, value, timeout, version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        if not self._shared.add(key, value, timeout, version=version):
+            return False
+        self._local_set(key, value, timeout, version)
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._shared.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._local.delete(key, version=version)
+        return self._shared.delete(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self._shared.incr(key, delta, version=version)
+        self._local_set(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def has_key(self, key, version=None):
+        return (self._local.has_key(key, version=version)
+                or self._shared.has_key(key, version=version))
+
+    def clear(self):
+        self._local.clear()
+        self._shared.clear()
+
+    def close(self, **kwargs):
+        self._shared.close(**kwargs)
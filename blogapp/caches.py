@@ -0,0 +1,236 @@
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, OuterRef, Subquery
+from django.utils import timezone
+
+from .models import Category, Like, Post, PriceHistory
+
+
+CATEGORY_PREVIEW_NUM = 5
+CATEGORY_LATEST_NUM = 5
+
+# プロセス内のメモ {キー: (次に確かめる時刻, 世代の名前, 世代番号, 値)}
+_memo = {}
+
+# ヒット・ミスの回数(ワーカーごと)
+stats = Counter()
+
+
+def _new_version():
+    # キャッシュが消えた後に、プロセス内のメモに残っている番号と重ならないようにする
+    return int(time.time() * 1000)
+
+
+def get_version(name):
+    """キャッシュの世代番号を返す。bump_versionで古いキャッシュをまとめて無効にする"""
+    key = 'blogapp:version:{}'.format(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version())
+        version = cache.get(key)
+    return version
+
+
+def bump_version(name):
+    key = 'blogapp:version:{}'.format(name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version())
+    # このプロセスのメモはすぐに読み直させる
+    for memo_key in [k for k, memo in _memo.items() if memo[1] == name]:
+        del _memo[memo_key]
+
+
+def memoize(key, name, load, on_change=None):
+    """プロセス内のメモから値を返す。メモが無ければload(世代番号)で作る
+
+    世代番号はCACHE_LOCAL_TIMEOUT秒ごとにしか確かめないので、メモのヒットにはI/Oがない。
+    他のワーカーでのbump_version(name)は、その秒数のうちに伝わり、そのときはon_change()も呼ぶ。
+    """
+    now = time.monotonic()
+    memo = _memo.get(key)
+    if memo is not None and now < memo[0]:
+        stats['{}.memo_hit'.format(key)] += 1
+        return memo[3]
+
+    version = get_version(name)
+    if memo is not None and memo[2] == version:
+        stats['{}.memo_hit'.format(key)] += 1
+        value = memo[3]
+    else:
+        if memo is not None and on_change is not None:
+            on_change()
+        value = load(version)
+    _memo[key] = (now + settings.CACHE_LOCAL_TIMEOUT, name, version, value)
+    return value
+
+
+def _latest_posts_per_category(limit):
+    """カテゴリごとの最新記事をlimit件ずつ、1クエリで取得する"""
+    if connection.features.supports_over_clause:
+        table = Post._meta.db_table
+        return Post.objects.raw(
+            'SELECT id, title, category_id FROM ('
+            ' SELECT id, title, category_id, ROW_NUMBER() OVER ('
+            '  PARTITION BY category_id ORDER BY created_at DESC, id DESC'
+            ' ) AS rn FROM {}'
+            ') ranked WHERE rn <= %s ORDER BY category_id, rn'.format(table),
+            [limit])
+
+    # ウィンドウ関数が使えない古いSQLite向け
+    latest = (Post.objects.filter(category=OuterRef('category'))
+              .order_by('-created_at', '-id').values('pk')[:limit])
+    return (Post.objects.filter(pk__in=Subquery(latest))
+            .only('id', 'title', 'category_id')
+            .order_by('category_id', '-created_at', '-id'))
+
+
+def category_summary():
+    """カテゴリ一覧ページ用に、記事数と最新記事を付けたカテゴリのリストを返す"""
+    key = 'blogapp:category_summary:{}'.format(get_version('category'))
+    category_list = cache.get(key)
+    if category_list is not None:
+        return category_list
+
+    category_list = list(
+        Category.objects.annotate(num_posts=Count('post')).order_by('pk'))
+    previews = {category.pk: [] for category in category_list}
+    for post in _latest_posts_per_category(CATEGORY_PREVIEW_NUM):
+        previews.setdefault(post.category_id, []).append(post)
+    for category in category_list:
+        category.preview_posts = previews[category.pk]
+
+    cache.set(key, category_list)
+    return category_list
+
+
+def _load_nav_categories(version):
+    key = 'blogapp:nav_categories:{}'.format(version)
+    category_list = cache.get(key)
+    if category_list is None:
+        stats['nav_categories.miss'] += 1
+        category_list = list(
+            Category.objects.only('id', 'name', 'name_en').order_by('pk'))
+        cache.set(key, category_list)
+    else:
+        stats['nav_categories.cache_hit'] += 1
+    return category_list
+
+
+def nav_categories():
+    """ナビバー用のカテゴリ一覧
+
+    プロセス内のメモ、共有キャッシュ、DBの順に探す。
+    """
+    return memoize('nav_categories', 'category_nav', _load_nav_categories)
+
+
+def _purchased_key(user_id):
+    return 'blogapp:purchased:{}'.format(user_id)
+
+
+def purchased_post_ids(user):
+    """ユーザーが購入した記事idのfrozenset。リクエスト中はuserに保持する"""
+    if not user.is_authenticated:
+        return frozenset()
+    if hasattr(user, '_purchased_post_ids'):
+        return user._purchased_post_ids
+
+    key = _purchased_key(user.pk)
+    post_ids = cache.get(key)
+    if post_ids is None:
+        post_ids = frozenset(
+            PriceHistory.objects.filter(user=user).order_by()
+            .values_list('post_id', flat=True).distinct())
+        cache.set(key, post_ids)
+    user._purchased_post_ids = post_ids
+    return post_ids
+
+
+def clear_purchased_post_ids(user_id):
+    cache.delete(_purchased_key(user_id))
+
+
+def _liked_key(user_id):
+    return 'blogapp:liked:{}'.format(user_id)
+
+
+def liked_post_ids(user):
+    """ユーザーがいいねした記事idのfrozenset。リクエスト中はuserに保持する"""
+    if not user.is_authenticated:
+        return frozenset()
+    if hasattr(user, '_liked_post_ids'):
+        return user._liked_post_ids
+
+    key = _liked_key(user.pk)
+    post_ids = cache.get(key)
+    if post_ids is None:
+        post_ids = frozenset(
+            Like.objects.filter(user=user).values_list('post_id', flat=True))
+        cache.set(key, post_ids)
+    user._liked_post_ids = post_ids
+    return post_ids
+
+
+def clear_liked_post_ids(user_id):
+    cache.delete(_liked_key(user_id))
+
+
+def _post_fragments_name(post_id):
+    return 'post_fragments:{}'.format(post_id)
+
+
+def post_fragments_version(post_id):
+    """記事詳細ページのレンダリング済みHTMLのキーに入れる世代番号"""
+    return get_version(_post_fragments_name(post_id))
+
+
+def clear_post_fragments(post):
+    """記事詳細ページのレンダリング済みHTMLを、すべてのワーカーで使わなくする"""
+    bump_version(_post_fragments_name(post.pk))
+
+
+def _category_posts_key(category_id):
+    return 'blogapp:category_posts:{}'.format(category_id)
+
+
+def refresh_category_posts(category_id):
+    """カテゴリの最新記事(idとタイトル)のリストを作り直してキャッシュする"""
+    posts = list(
+        Post.objects.filter(category_id=category_id)
+        .order_by('-created_at', '-id').values('id', 'title')[:CATEGORY_LATEST_NUM])
+    cache.set(_category_posts_key(category_id), posts)
+    return posts
+
+
+def category_latest_posts(category_id):
+    """記事詳細の「このカテゴリの他の記事」。記事の保存時に作り直される"""
+    posts = cache.get(_category_posts_key(category_id))
+    if posts is None:
+        posts = refresh_category_posts(category_id)
+    return posts
+
+
+def _changed_at_key(name):
+    return 'blogapp:changed_at:{}'.format(name)
+
+
+def changed_at(name):
+    """nameの範囲で最後に変更があった日時。キャッシュに無ければ今変わったものとみなす"""
+    key = _changed_at_key(name)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, timezone.now())
+        value = cache.get(key)
+    return value
+
+
+def mark_changed(*names):
+    """条件付きGETの検証子を変えるため、変更日時を記録する"""
+    now = timezone.now()
+    cache.set_many({_changed_at_key(name): now for name in names})
@@ -0,0 +1,15 @@
+from django.db.models import Prefetch
+
+from .models import Comment, Reply
+from .pagination import paginate_keyset
+
+
+COMMENTS_PER_PAGE = 20
+COMMENT_ORDERING = ('-created_at', '-id')
+
+
+def load_comment_page(post, cursor=None, per_page=COMMENTS_PER_PAGE):
+    """記事のコメントを新しい順に1ページ分、返信と合わせて2クエリで取得する"""
+    comments = Comment.objects.filter(post=post).prefetch_related(
+        Prefetch('replies', queryset=Reply.objects.order_by('created_at', 'id')))
+    return paginate_keyset(comments, COMMENT_ORDERING, per_page, after=cursor)
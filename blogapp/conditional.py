@@ -0,0 +1,66 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.views.decorators.http import condition
+
+from .caches import changed_at
+
+
+def viewer_key(request):
+    """ページの見た目を変えるログイン状態とCSRFトークンを表す文字列"""
+    user = request.user
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    if user.is_authenticated:
+        return 'user:{}:{}'.format(user.pk, csrf_cookie)
+    return 'anonymous:{}'.format(csrf_cookie)
+
+
+class ConditionalGetMixin:
+    """GETにETagとLast-Modifiedを付け、変わっていなければ304を返す
+
+    検証子は、ページに出る記事の最終更新日時(インデックスで引ける)、
+    シグナルで記録した変更日時、閲覧者から作る。304のときはテンプレートを描画しない。
+    changed_scopesは、ページの内容を変えるmark_changed()の名前。
+    """
+    changed_scopes = ('site',)
+
+    def get_last_updated(self):
+        """最初の要素がページに出る記事の最終更新日時のタプル。Noneなら条件付きGETを行わない"""
+        return None
+
+    def get_changed_scopes(self):
+        return self.changed_scopes
+
+    def get_validators(self):
+        if hasattr(self, '_validators'):
+            return self._validators
+
+        self._validators = (None, None)
+        # 表示待ちのメッセージがあるときは描画し直す
+        if len(get_messages(self.request)):
+            return self._validators
+        stamp = self.get_last_updated()
+        if stamp is None:
+            return self._validators
+
+        changed = [changed_at(name) for name in self.get_changed_scopes()]
+        value = '{}:{}:{}'.format(
+            stamp, [c.isoformat() for c in changed], viewer_key(self.request))
+        etag = hashlib.md5(value.encode()).hexdigest()
+
+        last_modified = None
+        if not self.request.user.is_authenticated:
+            # ログイン中はユーザーごとに内容が違うので、ETagだけで判定させる
+            last_modified = max(t for t in [stamp[0], *changed] if t is not None)
+        self._validators = (etag, last_modified)
+        return self._validators
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        view = condition(
+            etag_func=lambda *a, **kw: self.get_validators()[0],
+            last_modified_func=lambda *a, **kw: self.get_validators()[1],
+        )(super().dispatch)
+        return view(request, *args, **kwargs)
@@ -1,8 +1,11 @@
-from .models import Category
+from django.utils.functional import SimpleLazyObject
+
+from .caches import nav_categories
 
 
 def all_category(request):
-    category_list = Category.objects.all()
+    # ナビバーを表示しないページでは取得しない
+    category_list = SimpleLazyObject(nav_categories)
 
     params = {
         'category_list': category_list,
@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from .models import Post, Comment, Reply
+from .mail import enqueue_mail
+from .timing import timed
 from django.contrib.auth.forms import (
     AuthenticationForm, UserCreationForm, PasswordChangeForm,
     PasswordResetForm, SetPasswordForm
@@ -95,6 +97,10 @@ class MyPasswordResetForm(PasswordResetForm):
         for field in self.fields.values():
             field.widget.attrs['class'] = 'form-control'
 
+    def send_mail(self, *args, **kwargs):
+        with timed('smtp'):
+            super().send_mail(*args, **kwargs)
+
 
 class MySetPasswordForm(SetPasswordForm):
     """パスワード再設定用フォーム(パスワード忘れて再設定)"""
@@ -152,15 +158,12 @@ class ContactForm(forms.Form):
         sender = self.cleaned_data['email']
         subject = self.cleaned_data['subject']
         recipient_list = [settings.EMAIL_HOST_USER]
-        try:
-            message = EmailMessage(subject="名前: " + name + " 内容: " + subject,
-                            body="From："+sender+"\n"+message,
-                            from_email=email,
-                            to=recipient_list,
-                        )
-            message.send()
-        except BadHeaderError:
-            return HttpResponse('無効なヘッダが検出されました。')
+        # 送信はワーカーで行う。件名の改行はenqueue_mailで取り除かれる
+        enqueue_mail(subject="名前: " + name + " 内容: " + subject,
+                     message="From："+sender+"\n"+message,
+                     from_email=email,
+                     recipient_list=recipient_list,
+                     )
 
 
 class CommentForm(ModelForm):
@@ -0,0 +1,98 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from PIL import Image
+
+from .models import Post
+
+
+logger = logging.getLogger(__name__)
+
+# (拡張子, Pillowのフォーマット名)
+VARIANT_FORMATS = (
+    ('webp', 'WEBP'),
+    ('jpg', 'JPEG'),
+)
+
+_executor = None
+
+
+def get_executor():
+    """縮小版を作るスレッドプール。gunicornのfork後に作られるよう、初回の利用時に作る"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.THUMBNAIL_WORKERS,
+            thread_name_prefix='thumbnail')
+    return _executor
+
+
+def variant_name(name, width, ext):
+    root, _ = os.path.splitext(name)
+    return '{}_w{}.{}'.format(root, width, ext)
+
+
+def variant_url(name, width, ext, storage=default_storage):
+    return storage.url(variant_name(name, width, ext))
+
+
+def generate_variants(name, storage=default_storage):
+    """元画像の隣に、幅ごとのWebPとJPEGの縮小版を保存する。作成した幅のリストを返す
+
+    拡大はしないので、元画像の幅以上の設定は元画像の幅で1つだけ作る。
+    """
+    with storage.open(name, 'rb') as f:
+        image = Image.open(f)
+        image.load()
+    if image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    widths = []
+    for width in sorted(settings.THUMBNAIL_WIDTHS):
+        resized = image.copy()
+        resized.thumbnail((width, image.height), Image.LANCZOS)
+        for ext, image_format in VARIANT_FORMATS:
+            buffer = BytesIO()
+            resized.save(buffer, image_format, quality=settings.THUMBNAIL_QUALITY)
+            target = variant_name(name, resized.width, ext)
+            if storage.exists(target):
+                storage.delete(target)
+            storage.save(target, ContentFile(buffer.getvalue()))
+        widths.append(resized.width)
+        if resized.width >= image.width:
+            break
+    return widths
+
+
+def process_post_thumbnail(post_id, name):
+    """縮小版を作り、記事に作成済みの幅を記録する"""
+    from .caches import clear_post_fragments
+
+    try:
+        try:
+            widths = generate_variants(name)
+        except Exception:
+            logger.exception('サムネイルの縮小版を作成できませんでした: %s', name)
+            return None
+
+        # シグナルを送らないようupdate()で保存する。画像が差し替えられていたら記録しない
+        value = ','.join(str(width) for width in widths)
+        if Post.objects.filter(pk=post_id, thumbnail=name).update(thumbnail_widths=value):
+            clear_post_fragments(Post(pk=post_id))
+        return widths
+    finally:
+        # スレッドごとのDB接続を閉じる
+        connections.close_all()
+
+
+def schedule_post_thumbnail(post):
+    """コミット後に、バックグラウンドのスレッドで縮小版を作る"""
+    post_id, name = post.pk, post.thumbnail.name
+    transaction.on_commit(
+        lambda: get_executor().submit(process_post_thumbnail, post_id, name))
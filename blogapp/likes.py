@@ -0,0 +1,67 @@
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+
+from .caches import clear_liked_post_ids, mark_changed
+from .models import Like, Post
+
+
+def _toggle_like_postgresql(user_id, post_id):
+    """削除、無ければ追加、いいね数の更新を1つのSQL文で行う"""
+    like_table = Like._meta.db_table
+    post_table = Post._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'WITH deleted AS ('
+            ' DELETE FROM {like} WHERE user_id = %(user)s AND post_id = %(post)s'
+            ' RETURNING 1'
+            '), inserted AS ('
+            ' INSERT INTO {like} (user_id, post_id)'
+            ' SELECT %(user)s, %(post)s'
+            ' WHERE NOT EXISTS (SELECT 1 FROM deleted)'
+            ' AND EXISTS (SELECT 1 FROM {post} WHERE id = %(post)s)'
+            ' ON CONFLICT (user_id, post_id) DO NOTHING'
+            ' RETURNING 1'
+            ') UPDATE {post}'
+            ' SET like_num = like_num'
+            ' + (SELECT COUNT(*) FROM inserted) - (SELECT COUNT(*) FROM deleted)'
+            ' WHERE id = %(post)s'
+            ' RETURNING like_num, EXISTS (SELECT 1 FROM inserted)'.format(
+                like=like_table, post=post_table),
+            {'user': user_id, 'post': post_id})
+        row = cursor.fetchone()
+    if row is None:
+        raise Post.DoesNotExist
+    return row[1], row[0]
+
+
+def _toggle_like_orm(user_id, post_id):
+    with transaction.atomic():
+        try:
+            # 一意制約に任せて追加し、既にあれば削除する
+            with transaction.atomic():
+                Like.objects.create(user_id=user_id, post_id=post_id)
+            liked, delta = True, 1
+        except IntegrityError:
+            deleted, _ = Like.objects.filter(user_id=user_id, post_id=post_id).delete()
+            liked, delta = False, -deleted
+        # 記事が無ければ更新件数が0になるので、追加したいいねごと取り消す
+        if not Post.objects.filter(pk=post_id).update(like_num=F('like_num') + delta):
+            raise Post.DoesNotExist
+        like_num = Post.objects.filter(pk=post_id).values_list(
+            'like_num', flat=True).get()
+    return liked, like_num
+
+
+def toggle_like(user, post_id):
+    """いいねを付け外しし、(いいね済みか, いいね数)を返す
+
+    記事が無ければPost.DoesNotExistを送出する。
+    """
+    if connection.vendor == 'postgresql':
+        liked, like_num = _toggle_like_postgresql(user.pk, post_id)
+    else:
+        liked, like_num = _toggle_like_orm(user.pk, post_id)
+    # SQLで直接変更したときはシグナルが送られないので、ここで無効にする
+    clear_liked_post_ids(user.pk)
+    mark_changed('post:{}'.format(post_id), 'post_list')
+    return liked, like_num
@@ -0,0 +1,116 @@
+import datetime
+import logging
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import QueuedMail
+
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 60 * 60
+# 送信中のメールを他のワーカーが拾わないように、次回送信日時をずらしておく時間
+LEASE_SECONDS = 10 * 60
+
+
+def enqueue_mail(subject, message, from_email=None, recipient_list=()):
+    """メールを送信待ちに登録する。SMTPへの接続はワーカー側で行う"""
+    recipients = []
+    for address in recipient_list:
+        if address and address not in recipients:
+            recipients.append(address)
+    if not recipients:
+        return None
+
+    # 件名に改行があるとヘッダーエラーになる
+    subject = ''.join(subject.splitlines())
+    return QueuedMail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or '',
+        recipients='\n'.join(recipients),
+    )
+
+
+def retry_delay(attempts):
+    seconds = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+    return datetime.timedelta(seconds=seconds)
+
+
+def claim_batch(batch_size):
+    """送信時刻になったメールをbatch_size件まで確保する"""
+    now = timezone.now()
+    with transaction.atomic():
+        mails = list(
+            QueuedMail.objects.select_for_update(skip_locked=True)
+            .filter(status=QueuedMail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:batch_size])
+        QueuedMail.objects.filter(pk__in=[mail.pk for mail in mails]).update(
+            next_attempt_at=now + datetime.timedelta(seconds=LEASE_SECONDS))
+    return mails
+
+
+def send_queued_mail(batch_size=50):
+    """送信待ちのメールを1バッチ分送信し、(送信数, 失敗数)を返す
+
+    SMTPの接続はバッチの中で1本だけ使う。失敗したメールは間隔を伸ばしながら
+    MAX_ATTEMPTS回まで再送する。
+    """
+    mails = claim_batch(batch_size)
+    if not mails:
+        return 0, 0
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        # SMTPに繋がらないときは、確保したメールすべてを1回失敗したものとして扱う
+        logger.warning('SMTPサーバーに接続できませんでした: %r', e)
+        for mail in mails:
+            _record_failure(mail, e)
+        return 0, len(mails)
+
+    sent = failed = 0
+    try:
+        for mail in mails:
+            message = EmailMessage(
+                mail.subject, mail.body, mail.from_email or None,
+                mail.recipient_list(), connection=connection)
+            try:
+                message.send()
+            except Exception as e:
+                failed += 1
+                _record_failure(mail, e)
+            else:
+                sent += 1
+                mail.attempts += 1
+                mail.status = QueuedMail.STATUS_SENT
+                mail.sent_at = timezone.now()
+                mail.last_error = ''
+                _save(mail)
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            logger.warning('SMTPの接続を閉じられませんでした', exc_info=True)
+    return sent, failed
+
+
+def _save(mail):
+    mail.save(update_fields=[
+        'attempts', 'status', 'next_attempt_at', 'last_error', 'sent_at'])
+
+
+def _record_failure(mail, error):
+    """間隔を伸ばして再送を予約する。MAX_ATTEMPTS回失敗したら諦める"""
+    mail.attempts += 1
+    mail.last_error = repr(error)
+    if mail.attempts >= MAX_ATTEMPTS:
+        mail.status = QueuedMail.STATUS_FAILED
+    else:
+        mail.next_attempt_at = timezone.now() + retry_delay(mail.attempts)
+    _save(mail)
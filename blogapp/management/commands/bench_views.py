@@ -0,0 +1,162 @@
+import io
+import json
+import time
+
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.core.signing import dumps
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext, setup_databases, setup_test_environment,
+    teardown_databases, teardown_test_environment,
+)
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlencode, urlsafe_base64_encode
+
+from blogapp import urls as blog_urls
+from blogapp.models import Category, Comment, Reply, User
+from blogapp.timing import percentile
+
+
+# ログアウトすると後のページが測れないので除外する
+SKIP_ROUTES = {'logout'}
+
+QUERY_STRINGS = {
+    'search': {'freeword': '記事'},
+}
+
+
+class Command(BaseCommand):
+    """blogapp/urls.pyの全ページを、データ量を変えながらテスト用DBで計測する"""
+    help = 'Benchmark every blogapp route at several data sizes and write the results as JSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', default='100,1000',
+            help='記事数(カンマ区切り)。ほかのデータは記事数に比例させる')
+        parser.add_argument(
+            '--requests', type=int, default=20,
+            help='1ページあたりのリクエスト回数(初回を除く)')
+        parser.add_argument(
+            '--output', default='bench.json',
+            help='結果を書き出すJSONファイル')
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            results = []
+            for size in sizes:
+                results.extend(self.run_size(size, options['requests']))
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'requests': options['requests'],
+            'sizes': sizes,
+            'results': results,
+        }
+        with open(options['output'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        for row in results:
+            self.stdout.write(
+                '{size:>7} {route:<24} {status:<8} p50={p50_ms:8.2f}ms '
+                'p90={p90_ms:8.2f}ms p99={p99_ms:8.2f}ms queries={queries}'.format(
+                    **dict(row, status=','.join(map(str, row['status'])))))
+        self.stdout.write(self.style.SUCCESS(
+            '{}に結果を書き出しました。'.format(options['output'])))
+
+    def seed(self, size):
+        call_command('flush', interactive=False, verbosity=0)
+        cache.clear()
+        caches['fragments'].clear()
+        call_command(
+            'seed_bench', posts=size, users=max(10, size // 10),
+            categories=max(3, size // 100), likes=size * 3, comments=size * 2,
+            replies=size, purchases=size // 2, stdout=io.StringIO())
+
+    def route_kwargs(self):
+        """URLの引数。ページが表示できるデータを選ぶ"""
+        admin = User.objects.create_superuser('bench-admin@example.com', 'password')
+        inactive = User.objects.create_user(
+            'bench-inactive@example.com', 'password', is_active=False)
+        comment = Comment.objects.filter(replies__isnull=False).order_by('pk').first()
+        post = comment.post
+        reply = Reply.objects.filter(comment=comment).order_by('pk').first()
+        category = Category.objects.get(pk=post.category_id)
+        # 削除確認ページを表示できるよう、本人のコメントにする
+        Comment.objects.filter(pk=comment.pk).update(useremail=admin.email)
+        Reply.objects.filter(pk=reply.pk).update(authority=admin.email)
+        self.admin = admin
+
+        return {
+            'post_detail': {'pk': post.pk},
+            'post_update': {'pk': post.pk},
+            'post_delete': {'pk': post.pk},
+            'comment_form': {'pk': post.pk},
+            'comment_page': {'pk': post.pk},
+            'like_add': {'post_id': post.pk},
+            'category_detail': {'name_en': category.name_en},
+            'user_detail': {'pk': admin.pk},
+            'user_update': {'pk': admin.pk},
+            'user_create_complete': {'token': dumps(inactive.pk)},
+            'password_reset_confirm': {
+                'uidb64': urlsafe_base64_encode(force_bytes(admin.pk)),
+                'token': default_token_generator.make_token(admin),
+            },
+            'comment_delete': {'pk': comment.pk},
+            'reply_form': {'pk': comment.pk},
+            'reply_delete': {'pk': reply.pk},
+        }
+
+    def run_size(self, size, requests):
+        self.seed(size)
+        kwargs = self.route_kwargs()
+        client = Client()
+
+        for pattern in blog_urls.urlpatterns:
+            # oauthやckeditorなどincludeしたURLは対象外
+            if not isinstance(pattern, URLPattern) or pattern.name in SKIP_ROUTES:
+                continue
+            url = reverse('blogapp:' + pattern.name, kwargs=kwargs.get(pattern.name))
+            if pattern.name in QUERY_STRINGS:
+                url += '?' + urlencode(QUERY_STRINGS[pattern.name])
+
+            client.force_login(self.admin)
+            start = time.perf_counter()
+            response = client.get(url)
+            cold_ms = (time.perf_counter() - start) * 1000
+
+            timings = []
+            queries = []
+            statuses = {response.status_code}
+            for _ in range(requests):
+                with CaptureQueriesContext(connection) as captured:
+                    start = time.perf_counter()
+                    response = client.get(url)
+                    timings.append((time.perf_counter() - start) * 1000)
+                queries.append(len(captured))
+                statuses.add(response.status_code)
+
+            yield {
+                'size': size,
+                'route': pattern.name,
+                'url': url,
+                'status': sorted(statuses),
+                'cold_ms': round(cold_ms, 2),
+                'p50_ms': round(percentile(timings, 50), 2),
+                'p90_ms': round(percentile(timings, 90), 2),
+                'p99_ms': round(percentile(timings, 99), 2),
+                'max_ms': round(max(timings), 2),
+                'queries': max(queries),
+            }
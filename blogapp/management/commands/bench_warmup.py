@@ -0,0 +1,76 @@
+import json
+import statistics
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+
+from blogapp.models import Category, Post
+
+
+# 新しいプロセスで最初の1リクエストだけを計る
+CHILD = '''
+import json, sys, time
+import django
+django.setup()
+from django.test import Client
+client = Client(raise_request_exception=False)
+# gunicornのワーカーと同じく、ミドルウェアは起動時に読み込まれる
+client.handler.load_middleware()
+if sys.argv[1] == 'warm':
+    from project.warmup import warm_up
+    warm_up()
+start = time.perf_counter()
+response = client.get(sys.argv[2])
+print(json.dumps([response.status_code, (time.perf_counter() - start) * 1000]))
+'''
+
+
+class Command(BaseCommand):
+    """ウォームアップの有無で、ワーカー起動直後の最初のリクエストの時間を比べる"""
+    help = 'Compare first-request latency of a fresh process with and without warm-up.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--trials', type=int, default=3,
+            help='1ページあたりの試行回数')
+        parser.add_argument(
+            '--output', default='',
+            help='結果を書き出すJSONファイル')
+
+    def urls(self):
+        urls = [reverse('blogapp:index'), reverse('blogapp:post_list'),
+                reverse('blogapp:category_list')]
+        post = Post.objects.exclude(thumbnail='').order_by('-pk').first()
+        if post is not None:
+            urls.append(reverse('blogapp:post_detail', args=[post.pk]))
+        category = Category.objects.order_by('pk').first()
+        if category is not None:
+            urls.append(reverse('blogapp:category_detail', args=[category.name_en]))
+        return urls
+
+    def first_request(self, mode, url):
+        output = subprocess.run(
+            [sys.executable, '-c', CHILD, mode, url],
+            check=True, stdout=subprocess.PIPE).stdout
+        # ウォームアップのログなどが混ざっても、最後の行だけを読む
+        return json.loads(output.decode().strip().splitlines()[-1])
+
+    def handle(self, *args, **options):
+        results = []
+        for url in self.urls():
+            row = {'url': url}
+            for mode in ('cold', 'warm'):
+                timings = []
+                for _ in range(options['trials']):
+                    status, elapsed = self.first_request(mode, url)
+                    timings.append(elapsed)
+                row[mode + '_ms'] = round(statistics.median(timings), 2)
+                row[mode + '_status'] = status
+            results.append(row)
+            self.stdout.write('{url:<32} cold={cold_ms:8.2f}ms warm={warm_ms:8.2f}ms'.format(**row))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,45 @@
+import datetime
+
+from ckeditor_uploader.utils import get_thumb_filename, storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from blogapp.models import Post
+from blogapp.uploads import list_uploads, referenced_uploads
+
+
+class Command(BaseCommand):
+    """どの記事からも参照されていないCKEditorのアップロードファイルを探す"""
+    help = 'Find (and optionally delete) CKEditor uploads no post references.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--delete', action='store_true',
+            help='見つかったファイルを削除する(指定しなければ一覧を表示するだけ)')
+        parser.add_argument(
+            '--min-age-hours', type=int, default=24,
+            help='この時間より新しいファイルは、編集中の記事のものとみなして残す')
+
+    def handle(self, *args, **options):
+        contents = Post.objects.values_list('content', flat=True).iterator(chunk_size=100)
+        referenced = referenced_uploads(contents)
+        referenced |= {get_thumb_filename(name) for name in referenced}
+        threshold = timezone.now() - datetime.timedelta(hours=options['min_age_hours'])
+
+        orphans = []
+        for name in list_uploads(storage):
+            if name in referenced:
+                continue
+            if storage.get_modified_time(name) > threshold:
+                continue
+            orphans.append(name)
+
+        for name in orphans:
+            self.stdout.write(name)
+            if options['delete']:
+                storage.delete(name)
+
+        message = '{}件の未使用ファイル'.format(len(orphans))
+        if options['delete']:
+            message += 'を削除しました。'
+        self.stdout.write(self.style.SUCCESS(message))
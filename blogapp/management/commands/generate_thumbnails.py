@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from blogapp.images import process_post_thumbnail
+from blogapp.models import Post
+
+
+class Command(BaseCommand):
+    """既存の記事のサムネイルの縮小版をまとめて作る"""
+    help = 'Generate responsive thumbnail variants for existing posts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=4,
+            help='並列に処理するスレッド数')
+        parser.add_argument(
+            '--force', action='store_true',
+            help='縮小版が作成済みの記事も作り直す')
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(thumbnail='')
+        if not options['force']:
+            posts = posts.filter(thumbnail_widths='')
+        targets = posts.order_by('pk').values_list('pk', 'thumbnail')
+
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            futures = [
+                executor.submit(process_post_thumbnail, pk, name)
+                for pk, name in targets.iterator()]
+            for future in as_completed(futures):
+                if future.result() is None:
+                    failed += 1
+                else:
+                    done += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            '作成: {}件 失敗: {}件'.format(done, failed)))
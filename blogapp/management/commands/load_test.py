@@ -0,0 +1,173 @@
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from blogapp.models import Post
+from blogapp.timing import percentile
+
+
+SERVERS = {
+    'wsgi': ('project.wsgi', None),
+    'asgi': ('project.asgi:application', 'uvicorn.workers.UvicornWorker'),
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def slow_request(port, path, slow):
+    """ヘッダーを少しずつ送り、レスポンスを最後まで読む遅いクライアント"""
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        for line in ('GET {} HTTP/1.1\r\n'.format(path),
+                     'Host: 127.0.0.1:{}\r\n'.format(port),
+                     'Connection: close\r\n',
+                     '\r\n'):
+            writer.write(line.encode())
+            await writer.drain()
+            await asyncio.sleep(slow)
+        response = await reader.read()
+    finally:
+        writer.close()
+    status = int(response.split(b' ', 2)[1]) if response else 0
+    return status, (time.perf_counter() - start) * 1000
+
+
+class Command(BaseCommand):
+    """遅いクライアントを大量に同時接続させ、WSGIとASGIのgunicornを比べる"""
+    help = 'Load-test the read-heavy pages under sync WSGI and ASGI with many slow clients.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--servers', default='wsgi,asgi',
+            help='比べるサーバー(wsgi, asgi)。asgiにはrequirements-asgi.txtが要る')
+        parser.add_argument(
+            '--clients', type=int, default=100,
+            help='同時に接続するクライアント数')
+        parser.add_argument(
+            '--requests', type=int, default=5,
+            help='クライアント1つあたりのリクエスト数')
+        parser.add_argument(
+            '--slow-ms', type=int, default=100,
+            help='クライアントがヘッダーを1行送るごとに待つ時間')
+        parser.add_argument(
+            '--workers', type=int, default=1,
+            help='gunicornのワーカー数')
+        parser.add_argument(
+            '--threads', type=int, default=4,
+            help='WSGI(gthread)のワーカーあたりのスレッド数')
+        parser.add_argument(
+            '--asgi-worker-class', default=SERVERS['asgi'][1],
+            help='ASGIで使うgunicornのワーカー')
+        parser.add_argument(
+            '--output', default='',
+            help='結果を書き出すJSONファイル')
+
+    def paths(self):
+        post = Post.objects.exclude(thumbnail='').order_by('-pk').first()
+        if post is None:
+            raise CommandError('記事がありません。seed_benchでデータを作ってください。')
+        return [reverse('blogapp:index'), reverse('blogapp:post_list'),
+                reverse('blogapp:post_detail', args=[post.pk])]
+
+    def start_server(self, name, port, options):
+        app, worker_class = SERVERS[name]
+        if name == 'asgi':
+            worker_class = options['asgi_worker_class']
+        env = dict(
+            os.environ, PORT=str(port),
+            WEB_CONCURRENCY=str(options['workers']),
+            GUNICORN_THREADS=str(options['threads']))
+        if worker_class:
+            env['GUNICORN_WORKER_CLASS'] = worker_class
+        process = subprocess.Popen(
+            [shutil.which('gunicorn') or 'gunicorn', '-c',
+             os.path.join(settings.BASE_DIR, 'gunicorn.conf.py'), app],
+            cwd=settings.BASE_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # ポートが開くまで待つ
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError('{}のサーバーが起動しませんでした。'.format(name))
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                return process
+            except OSError:
+                time.sleep(0.2)
+        process.terminate()
+        raise CommandError('{}のサーバーが起動しませんでした。'.format(name))
+
+    async def run_clients(self, port, paths, options):
+        slow = options['slow_ms'] / 1000
+
+        async def client(index):
+            results = []
+            for i in range(options['requests']):
+                path = paths[(index + i) % len(paths)]
+                try:
+                    results.append(await slow_request(port, path, slow))
+                except OSError:
+                    results.append((0, None))
+            return results
+
+        # 最初の1リクエストで、ワーカーの準備が済んでいることを確かめる
+        await slow_request(port, paths[0], 0)
+        start = time.perf_counter()
+        batches = await asyncio.gather(*[client(i) for i in range(options['clients'])])
+        return [r for batch in batches for r in batch], time.perf_counter() - start
+
+    def handle(self, *args, **options):
+        paths = self.paths()
+        rows = []
+        for name in options['servers'].split(','):
+            port = free_port()
+            process = self.start_server(name, port, options)
+            try:
+                results, elapsed = asyncio.run(self.run_clients(port, paths, options))
+            finally:
+                process.terminate()
+                process.wait()
+
+            timings = [ms for status, ms in results if status == 200]
+            row = {
+                'server': name,
+                'requests': len(results),
+                'errors': len(results) - len(timings),
+                'seconds': round(elapsed, 2),
+                'rps': round(len(timings) / elapsed, 1),
+            }
+            if timings:
+                row.update({
+                    'p50_ms': round(percentile(timings, 50), 1),
+                    'p90_ms': round(percentile(timings, 90), 1),
+                    'p99_ms': round(percentile(timings, 99), 1),
+                })
+            rows.append(row)
+            self.stdout.write(json.dumps(row))
+
+        if options['output']:
+            report = {
+                'clients': options['clients'],
+                'requests': options['requests'],
+                'slow_ms': options['slow_ms'],
+                'workers': options['workers'],
+                'threads': options['threads'],
+                'paths': paths,
+                'results': rows,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,53 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from blogapp.models import PriceHistory
+from blogapp.sales import rebuild_sales
+
+
+def parse_date(value):
+    try:
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise CommandError('日付はYYYY-MM-DDの形式で指定してください: {}'.format(value))
+
+
+class Command(BaseCommand):
+    """PriceHistoryから日ごとの売上集計を作り直す"""
+    help = 'Rebuild or backfill the daily sales rollups from PriceHistory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since', type=parse_date,
+            help='この日から作り直す(YYYY-MM-DD)。省略すると最初の購入の日から')
+        parser.add_argument(
+            '--until', type=parse_date,
+            help='この日まで作り直す(YYYY-MM-DD)。省略すると今日まで')
+        parser.add_argument(
+            '--chunk-days', type=int, default=31,
+            help='一度に作り直す日数')
+
+    def handle(self, *args, **options):
+        since = options['since']
+        if since is None:
+            first = PriceHistory.objects.aggregate(first=Min('created_at'))['first']
+            if first is None:
+                self.stdout.write('購入がありません。')
+                return
+            since = timezone.localdate(first)
+        until = (options['until'] or timezone.localdate()) + datetime.timedelta(days=1)
+        step = datetime.timedelta(days=max(options['chunk_days'], 1))
+
+        total = 0
+        start = since
+        while start < until:
+            end = min(start + step, until)
+            total += rebuild_sales(start, end)
+            start = end
+
+        self.stdout.write(self.style.SUCCESS(
+            '{}から{}までの売上を集計しました({}行)。'.format(
+                since, until - datetime.timedelta(days=1), total)))
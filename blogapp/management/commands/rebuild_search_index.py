@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blogapp.models import Post, SearchToken
+from blogapp.search import build_tokens
+
+
+class Command(BaseCommand):
+    """記事検索のインデックスを全件作り直す
+
+    記事の塊ごとに古いトークンの削除と追加を1つのトランザクションで行うので、
+    作り直している間も検索できる。
+    """
+    help = 'Rebuild the search index for every post.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=200,
+            help='一度に処理する記事の件数')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+
+        total = 0
+        last_pk = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk).order_by('pk')
+                .only('pk', 'title', 'content')[:chunk_size])
+            if not posts:
+                break
+            last_pk = posts[-1].pk
+
+            tokens = []
+            for post in posts:
+                tokens.extend(build_tokens(post))
+            with transaction.atomic():
+                SearchToken.objects.filter(post__in=posts).delete()
+                SearchToken.objects.bulk_create(tokens, batch_size=1000)
+            total += len(posts)
+
+        self.stdout.write(self.style.SUCCESS(
+            '{}件の記事をインデックスしました。'.format(total)))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blogapp.models import Like, Post
+
+
+class Command(BaseCommand):
+    """Likeテーブルを数え直してPost.like_numを修正する"""
+    help = 'Recompute Post.like_num from the Like table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=500,
+            help='一度に数え直す記事の件数')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        like_count = Coalesce(Subquery(
+            Like.objects.filter(post=OuterRef('pk')).order_by()
+            .values('post').annotate(n=Count('pk')).values('n'),
+            output_field=IntegerField()), 0)
+
+        fixed = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                Post.objects.filter(pk__gt=last_pk).order_by('pk')
+                .values_list('pk', flat=True)[:chunk_size])
+            if not pks:
+                break
+            last_pk = pks[-1]
+
+            # ずれている記事を選び、UPDATE文の中で数え直した値を入れる。
+            # Pythonで数えた値を書き込まないので、選んだ後に増えたいいねも失われない
+            wrong = (Post.objects.filter(pk__in=pks)
+                     .annotate(actual=like_count)
+                     .exclude(like_num=F('actual'))
+                     .values_list('pk', flat=True))
+            fixed += Post.objects.filter(pk__in=list(wrong)).update(
+                like_num=like_count)
+
+        self.stdout.write(self.style.SUCCESS(
+            '{}件の記事のいいね数を修正しました。'.format(fixed)))
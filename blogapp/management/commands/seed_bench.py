@@ -0,0 +1,165 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from blogapp.caches import bump_version, mark_changed
+from blogapp.models import Category, Comment, Like, Post, PriceHistory, Reply, User
+
+
+EMAIL_DOMAIN = 'bench.example.com'
+CATEGORY_PREFIX = 'bench-'
+THUMBNAIL = 'images/dog-5357794_640.jpg'
+WORDS = ['記事', 'ブログ', 'Python', 'Django', '開発', 'テスト', '設計', '性能', 'データ', '運用']
+
+
+class Command(BaseCommand):
+    """ベンチマーク用のダミーデータをbulk_createでまとめて作る"""
+    help = 'Generate synthetic users, categories, posts, likes, comments, replies and purchases.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--categories', type=int, default=10)
+        parser.add_argument('--posts', type=int, default=1000)
+        parser.add_argument('--likes', type=int, default=3000)
+        parser.add_argument('--comments', type=int, default=2000)
+        parser.add_argument('--replies', type=int, default=1000)
+        parser.add_argument('--purchases', type=int, default=500)
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='一度にINSERTする件数')
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='乱数のシード。同じ値なら同じデータになる')
+        parser.add_argument(
+            '--clear', action='store_true',
+            help='前回作ったダミーデータを先に削除する')
+        parser.add_argument(
+            '--no-search-index', action='store_true',
+            help='検索インデックスを作り直さない')
+
+    def handle(self, *args, **options):
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        if options['clear']:
+            self.clear()
+
+        with transaction.atomic():
+            users = self.create_users(options['users'])
+            categories = self.create_categories(options['categories'])
+            posts = self.create_posts(options['posts'], users, categories)
+            self.create_likes(options['likes'], users, posts)
+            comments = self.create_comments(options['comments'], posts)
+            self.create_replies(options['replies'], comments)
+            self.create_purchases(options['purchases'], users, posts)
+
+        if not options['no_search_index']:
+            call_command('rebuild_search_index', stdout=self.stdout)
+        call_command('rebuild_sales', stdout=self.stdout)
+
+        # bulk_createはシグナルを送らないので、キャッシュはここで無効にする
+        for name in ('category', 'category_nav', 'sitemap', 'post_sidebar'):
+            bump_version(name)
+        mark_changed('site')
+
+        self.stdout.write(self.style.SUCCESS(
+            'ユーザー{}人、カテゴリ{}件、記事{}件を作成しました。'.format(
+                len(users), len(categories), len(posts))))
+
+    def clear(self):
+        users = User.objects.filter(email__endswith='@' + EMAIL_DOMAIN)
+        # LikeのユーザーはPROTECTなので先に消す
+        Like.objects.filter(user__in=users).delete()
+        users.delete()
+        Category.objects.filter(name_en__startswith=CATEGORY_PREFIX).delete()
+
+    def sentence(self, n):
+        return ''.join(self.random.choice(WORDS) for _ in range(n))
+
+    def create_users(self, count):
+        # ハッシュ化は重いので全員同じパスワードにする
+        password = make_password('password')
+        start = User.objects.filter(email__endswith='@' + EMAIL_DOMAIN).count()
+        emails = ['user{}@{}'.format(start + i, EMAIL_DOMAIN) for i in range(count)]
+        User.objects.bulk_create([
+            User(email=email, name='ユーザー{}'.format(start + i), password=password)
+            for i, email in enumerate(emails)], batch_size=self.batch_size)
+        # SQLiteではbulk_createでpkが入らないので読み直す
+        return list(User.objects.filter(email__in=emails).order_by('pk'))
+
+    def create_categories(self, count):
+        start = Category.objects.filter(name_en__startswith=CATEGORY_PREFIX).count()
+        names = ['{}{}'.format(CATEGORY_PREFIX, start + i) for i in range(count)]
+        Category.objects.bulk_create([
+            Category(name='カテゴリ{}'.format(start + i), name_en=name)
+            for i, name in enumerate(names)], batch_size=self.batch_size)
+        return list(Category.objects.filter(name_en__in=names).order_by('pk'))
+
+    def create_posts(self, count, users, categories):
+        if not users or not categories:
+            return []
+        now = timezone.now()
+        last_pk = Post.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        Post.objects.bulk_create([
+            Post(
+                author=self.random.choice(users),
+                title=self.sentence(4),
+                content='<p>{}</p>'.format(self.sentence(200)),
+                category=self.random.choice(categories),
+                thumbnail=THUMBNAIL,
+                price=self.random.randrange(100, 1000, 100),
+                updated_at=now - timedelta(minutes=self.random.randrange(60 * 24 * 365)))
+            for _ in range(count)], batch_size=self.batch_size)
+        return list(Post.objects.filter(pk__gt=last_pk).order_by('pk'))
+
+    def create_likes(self, count, users, posts):
+        # (ユーザー, 記事)は一意なので、組み合わせの番号から重複なく選ぶ
+        count = min(count, len(users) * len(posts))
+        pairs = [
+            divmod(i, len(posts))
+            for i in self.random.sample(range(len(users) * len(posts)), count)]
+        Like.objects.bulk_create([
+            Like(user=users[u], post=posts[p]) for u, p in pairs],
+            batch_size=self.batch_size)
+
+        for _, p in pairs:
+            posts[p].like_num += 1
+        Post.objects.bulk_update(posts, ['like_num'], batch_size=self.batch_size)
+
+    def create_comments(self, count, posts):
+        if not posts:
+            return []
+        last_pk = Comment.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        Comment.objects.bulk_create([
+            Comment(
+                post=self.random.choice(posts),
+                author='名前{}'.format(i),
+                text=self.sentence(20))
+            for i in range(count)], batch_size=self.batch_size)
+        return list(Comment.objects.filter(pk__gt=last_pk).order_by('pk'))
+
+    def create_replies(self, count, comments):
+        if not comments:
+            return
+        Reply.objects.bulk_create([
+            Reply(
+                comment=self.random.choice(comments),
+                author='名前{}'.format(i),
+                text=self.sentence(10))
+            for i in range(count)], batch_size=self.batch_size)
+
+    def create_purchases(self, count, users, posts):
+        if not users or not posts:
+            return
+        purchases = []
+        for i in range(count):
+            post = self.random.choice(posts)
+            purchases.append(PriceHistory(
+                post=post, user=self.random.choice(users),
+                stripe_id='ch_bench_{}'.format(i),
+                amount=post.price, category_id=post.category_id))
+        PriceHistory.objects.bulk_create(purchases, batch_size=self.batch_size)
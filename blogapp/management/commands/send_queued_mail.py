@@ -0,0 +1,45 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from blogapp.mail import send_queued_mail
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """送信待ちのメールを送信する"""
+    help = 'Send queued mail in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=50,
+            help='1回のSMTP接続で送信する件数')
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='終了せずに送信待ちを監視し続ける')
+        parser.add_argument(
+            '--interval', type=float, default=5,
+            help='--loopのとき、送信待ちが無い場合に待つ秒数')
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                sent, failed = send_queued_mail(options['batch_size'])
+            except Exception:
+                if not options['loop']:
+                    raise
+                # DBの障害などでもワーカーを止めず、接続を作り直して待つ
+                logger.exception('送信待ちのメールを処理できませんでした')
+                connections.close_all()
+                time.sleep(options['interval'])
+                continue
+            if sent or failed:
+                self.stdout.write('送信: {}件 失敗: {}件'.format(sent, failed))
+            if not options['loop']:
+                break
+            if not (sent or failed):
+                time.sleep(options['interval'])
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+from django.conf import settings
+
+from .timing import RequestTimings, current_timings, stats
+
+
+class ServerTimingMiddleware:
+    """SQL、テンプレート、外部呼び出しの時間をServer-Timingヘッダーで返し、URL名ごとに集計する
+
+    ヘッダーはスタッフにだけ返す(SERVER_TIMING_PUBLICなら誰にでも)。集計はすべてのリクエストで行う。
+    なるべく外側(MIDDLEWARE の先頭)に置く。WSGIでもASGIでも動く。
+    SQLの時間は、接続ごとに付けたexecute_wrapper(timing.install_sql_timer)が記録する。
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Djangoにこのミドルウェアを非同期として扱わせる
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        timings = RequestTimings()
+        token = timings.activate()
+        try:
+            response = self.get_response(request)
+        finally:
+            RequestTimings.deactivate(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        # sync_to_asyncで動くビューにもコンテキスト変数は引き継がれる
+        timings = RequestTimings()
+        token = timings.activate()
+        try:
+            response = await self.get_response(request)
+        finally:
+            RequestTimings.deactivate(token)
+        return self.finish(request, response, timings)
+
+    def finish(self, request, response, timings):
+        total = timings.total()
+        if self.show_header(request):
+            response['Server-Timing'] = self.header(timings, total)
+        match = request.resolver_match
+        stats.record(match.view_name if match else '<unresolved>', timings, total)
+        return response
+
+    def process_template_response(self, request, response):
+        # このあとすぐにレンダリングされるので、終わった時点で差を記録する
+        timings = current_timings()
+        if timings is not None:
+            start = time.perf_counter()
+            response.add_post_render_callback(
+                lambda r: timings.add('tpl', time.perf_counter() - start))
+        return response
+
+    @staticmethod
+    def show_header(request):
+        if settings.SERVER_TIMING_PUBLIC:
+            return True
+        user = getattr(request, 'user', None)
+        return user is not None and user.is_staff
+
+    @staticmethod
+    def header(timings, total):
+        metrics = []
+        for name, duration in timings.durations.items():
+            metric = '{};dur={:.1f}'.format(name, duration)
+            if name == 'db':
+                metric += ';desc="{} queries"'.format(timings.counts[name])
+            metrics.append(metric)
+        metrics.append('total;dur={:.1f}'.format(total))
+        return ', '.join(metrics)
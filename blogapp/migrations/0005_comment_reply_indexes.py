@@ -0,0 +1,21 @@
+# Generated by Django 3.1 on 2026-10-18 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0004_auto_20211104_0522'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_at'], name='blogapp_com_post_id_3a815d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['comment', 'created_at'], name='blogapp_rep_comment_ccd18b_idx'),
+        ),
+    ]
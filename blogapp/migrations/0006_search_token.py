@@ -0,0 +1,27 @@
+# Generated by Django 3.1 on 2026-10-18 03:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0005_comment_reply_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=2, verbose_name='トークン')),
+                ('score', models.IntegerField(default=0, verbose_name='スコア')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='blogapp.post')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='searchtoken',
+            constraint=models.UniqueConstraint(fields=('token', 'post'), name='unique_search_token'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.1 on 2026-10-18 03:08
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0006_search_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedMail',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=300, verbose_name='件名')),
+                ('body', models.TextField(verbose_name='本文')),
+                ('from_email', models.CharField(blank=True, max_length=254, verbose_name='送信元')),
+                ('recipients', models.TextField(help_text='1行に1アドレス', verbose_name='宛先')),
+                ('status', models.CharField(choices=[('pending', '送信待ち'), ('sent', '送信済み'), ('failed', '送信失敗')], default='pending', max_length=10, verbose_name='状態')),
+                ('attempts', models.IntegerField(default=0, verbose_name='送信回数')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='次回送信日時')),
+                ('last_error', models.TextField(blank=True, verbose_name='エラー')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='送信日時')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='queuedmail',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='blogapp_que_status_23b2a6_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1 on 2026-10-18 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0007_queued_mail'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pricehistory',
+            index=models.Index(fields=['user', 'post'], name='blogapp_pri_user_id_b7ab2e_idx'),
+        ),
+    ]
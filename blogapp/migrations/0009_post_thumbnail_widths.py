@@ -0,0 +1,18 @@
+# Generated by Django 3.1 on 2026-10-18 03:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0008_pricehistory_user_post_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='thumbnail_widths',
+            field=models.CharField(blank=True, editable=False, help_text='生成済みの縮小版の幅(カンマ区切り)', max_length=50, verbose_name='サムネイル縮小版の幅'),
+        ),
+    ]
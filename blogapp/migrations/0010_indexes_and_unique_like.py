@@ -0,0 +1,45 @@
+# Generated by Django 3.1 on 2026-10-18 03:18
+
+from django.db import migrations, models
+from django.db.models import Count, F, Min
+
+
+def remove_duplicate_likes(apps, schema_editor):
+    """同じユーザーの重複したいいねを1件にし、記事のいいね数を合わせる"""
+    Like = apps.get_model('blogapp', 'Like')
+    Post = apps.get_model('blogapp', 'Post')
+    duplicates = (Like.objects.values('user', 'post').order_by()
+                  .annotate(first_id=Min('id'), n=Count('id')).filter(n__gt=1))
+    for row in duplicates:
+        Like.objects.filter(user=row['user'], post=row['post']).exclude(
+            id=row['first_id']).delete()
+        Post.objects.filter(pk=row['post']).update(
+            like_num=F('like_num') - (row['n'] - 1))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0009_post_thumbnail_widths'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='name_en',
+            field=models.CharField(db_index=True, max_length=50, verbose_name='カテゴリ名英語'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['updated_at', 'id'], name='blogapp_pos_updated_db81f3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', 'created_at', 'id'], name='blogapp_pos_categor_299d0d_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='like',
+            constraint=models.UniqueConstraint(fields=('user', 'post'), name='unique_like'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.1 on 2026-10-18 03:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0010_indexes_and_unique_like'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyPostSales',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='日付')),
+                ('count', models.IntegerField(default=0, verbose_name='件数')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='売上')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='blogapp.category', verbose_name='カテゴリ')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='blogapp.post', verbose_name='記事')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailyCategorySales',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='日付')),
+                ('count', models.IntegerField(default=0, verbose_name='件数')),
+                ('revenue', models.BigIntegerField(default=0, verbose_name='売上')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='blogapp.category', verbose_name='カテゴリ')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='dailypostsales',
+            constraint=models.UniqueConstraint(fields=('date', 'post'), name='unique_daily_post_sales'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailycategorysales',
+            constraint=models.UniqueConstraint(fields=('date', 'category'), name='unique_daily_category_sales'),
+        ),
+    ]
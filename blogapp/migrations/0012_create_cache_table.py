@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+def cache_table(name):
+    """DatabaseCacheのテーブル(createcachetableで作るものと同じ形)
+
+    モデルとしては扱わないので、DBにだけ作る。
+    """
+    return migrations.SeparateDatabaseAndState(database_operations=[
+        migrations.CreateModel(
+            name=name.title().replace('_', ''),
+            fields=[
+                ('cache_key', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('expires', models.DateTimeField(db_index=True)),
+            ],
+            options={'db_table': name},
+        ),
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0011_daily_sales'),
+    ]
+
+    operations = [
+        cache_table('blogapp_cache'),
+    ]
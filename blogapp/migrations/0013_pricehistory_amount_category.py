@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def fill_amount_and_category(apps, schema_editor):
+    # 以前の購入は、今の記事の価格とカテゴリで埋める
+    Post = apps.get_model('blogapp', 'Post')
+    PriceHistory = apps.get_model('blogapp', 'PriceHistory')
+    post = Post.objects.filter(pk=OuterRef('post_id'))
+    PriceHistory.objects.update(
+        amount=Subquery(post.values('price')[:1]),
+        category_id=Subquery(post.values('category_id')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0012_create_cache_table'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pricehistory',
+            name='amount',
+            field=models.IntegerField(blank=True, null=True, verbose_name='金額'),
+        ),
+        migrations.AddField(
+            model_name='pricehistory',
+            name='category',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='blogapp.category', verbose_name='カテゴリ'),
+        ),
+        migrations.RunPython(fill_amount_and_category, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    # PostgreSQLでは、行の更新と同じトランザクションで外部キーの列を変更できないので分ける
+
+    dependencies = [
+        ('blogapp', '0013_pricehistory_amount_category'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pricehistory',
+            name='amount',
+            field=models.IntegerField(blank=True, verbose_name='金額'),
+        ),
+        migrations.AlterField(
+            model_name='pricehistory',
+            name='category',
+            field=models.ForeignKey(blank=True, on_delete=django.db.models.deletion.CASCADE, to='blogapp.category', verbose_name='カテゴリ'),
+        ),
+        migrations.RemoveField(
+            model_name='dailypostsales',
+            name='category',
+        ),
+    ]
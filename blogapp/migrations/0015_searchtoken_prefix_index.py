@@ -0,0 +1,17 @@
+# Generated by Django 3.1 on 2026-10-18 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogapp', '0014_pricehistory_amount_category_not_null'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='searchtoken',
+            index=models.Index(fields=['token'], name='search_token_prefix', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
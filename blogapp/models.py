@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from ckeditor_uploader.fields import RichTextUploadingField
 from django.utils import timezone
 from django.core.mail import send_mail
@@ -91,7 +91,7 @@ class User(AbstractBaseUser, PermissionsMixin):
 
 class Category(models.Model):
     name = models.CharField('カテゴリ名', max_length=50)
-    name_en = models.CharField('カテゴリ名英語', max_length=50)
+    name_en = models.CharField('カテゴリ名英語', max_length=50, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -110,10 +110,21 @@ class Post(models.Model):
     content = RichTextUploadingField('内容')
     category = models.ForeignKey('Category', on_delete=models.CASCADE)
     thumbnail = models.ImageField(upload_to='images/', blank=True)
+    thumbnail_widths = models.CharField(
+        'サムネイル縮小版の幅', max_length=50, blank=True, editable=False,
+        help_text='生成済みの縮小版の幅(カンマ区切り)')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(default=timezone.now)
     like_num = models.IntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            # 一覧の並び順(更新日時順)とキーセットページ分割用
+            models.Index(fields=['updated_at', 'id']),
+            # カテゴリごとの新着順
+            models.Index(fields=['category', 'created_at', 'id']),
+        ]
+
     def like_count(self):
         n = Like.objects.filter(post=self).count()
         return n
@@ -127,6 +138,12 @@ class Like(models.Model):
     user = models.ForeignKey(
         User, verbose_name="Likeしたユーザー", on_delete=models.PROTECT)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'post'], name='unique_like'),
+        ]
+
 
 class Comment(models.Model):
     post = models.ForeignKey(
@@ -139,6 +156,9 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['post', 'created_at']),
+        ]
 
     def __str__(self):
         return self.text
@@ -152,6 +172,11 @@ class Reply(models.Model):
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['comment', 'created_at']),
+        ]
+
     def __str__(self):
         return self.text
 
@@ -163,6 +188,119 @@ class PriceHistory(models.Model):
         User, verbose_name='購入ユーザー', on_delete=models.CASCADE)
     stripe_id = models.CharField('ID', max_length=200)
     created_at = models.DateTimeField('日付', default=timezone.now)
+    # 売上集計のため、購入時の記事の価格とカテゴリを記録する。空なら保存時に記事から入れる
+    amount = models.IntegerField('金額', blank=True)
+    category = models.ForeignKey(
+        Category, verbose_name='カテゴリ', on_delete=models.CASCADE, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'post']),
+        ]
 
     def __str__(self):
         return '{} {}'.format(self.post, self.user.email)
+
+    def save(self, *args, **kwargs):
+        if self.amount is None:
+            self.amount = self.post.price
+        if self.category_id is None:
+            self.category_id = self.post.category_id
+        # 購入の保存と、post_saveで行う売上集計への加算を同じトランザクションにする
+        # (rebuild_salesが集計中の購入を取りこぼさないように)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class DailyPostSales(models.Model):
+    """記事ごと・日ごとの売上。購入が記録されるたびに加算する(sales.py)"""
+    date = models.DateField('日付')
+    post = models.ForeignKey(Post, verbose_name='記事', on_delete=models.CASCADE)
+    count = models.IntegerField('件数', default=0)
+    revenue = models.BigIntegerField('売上', default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'post'], name='unique_daily_post_sales'),
+        ]
+
+    def __str__(self):
+        return '{} {}'.format(self.date, self.post_id)
+
+
+class DailyCategorySales(models.Model):
+    """カテゴリごと・日ごとの売上"""
+    date = models.DateField('日付')
+    category = models.ForeignKey(
+        Category, verbose_name='カテゴリ', on_delete=models.CASCADE)
+    count = models.IntegerField('件数', default=0)
+    revenue = models.BigIntegerField('売上', default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'category'], name='unique_daily_category_sales'),
+        ]
+
+    def __str__(self):
+        return '{} {}'.format(self.date, self.category_id)
+
+
+
+class SearchToken(models.Model):
+    """記事検索用の転置インデックス。タイトルと本文の文字bi-gramを記事ごとに持つ"""
+    token = models.CharField('トークン', max_length=2)
+    post = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name='search_tokens')
+    score = models.IntegerField('スコア', default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['token', 'post'], name='unique_search_token'),
+        ]
+        indexes = [
+            # 1文字の語の前方一致(LIKE 'x%')用。PostgreSQLでは照合順序がCでなくても使える
+            models.Index(
+                fields=['token'], name='search_token_prefix',
+                opclasses=['varchar_pattern_ops']),
+        ]
+
+    def __str__(self):
+        return self.token
+
+
+class QueuedMail(models.Model):
+    """送信待ちのメール。send_queued_mailコマンドがまとめて送信する"""
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = (
+        (STATUS_PENDING, '送信待ち'),
+        (STATUS_SENT, '送信済み'),
+        (STATUS_FAILED, '送信失敗'),
+    )
+
+    subject = models.CharField('件名', max_length=300)
+    body = models.TextField('本文')
+    from_email = models.CharField('送信元', max_length=254, blank=True)
+    recipients = models.TextField('宛先', help_text='1行に1アドレス')
+    status = models.CharField(
+        '状態', max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField('送信回数', default=0)
+    next_attempt_at = models.DateTimeField('次回送信日時', default=timezone.now)
+    last_error = models.TextField('エラー', blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField('送信日時', blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def recipient_list(self):
+        return self.recipients.split()
+
+    def __str__(self):
+        return self.subject
@@ -0,0 +1,175 @@
+from django.core import signing
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+
+CURSOR_SALT = 'blogapp.pagination.cursor'
+
+
+def _get_value(obj, field):
+    for name in field.split('__'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def encode_cursor(obj, ordering):
+    """並び順の列の値を、URLに載せられる署名付きの文字列にする"""
+    values = []
+    for field in ordering:
+        value = _get_value(obj, field.lstrip('-'))
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        values.append(value)
+    return signing.dumps(values, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(token, ordering):
+    """不正なカーソルはNoneを返し、最初のページとして扱う"""
+    try:
+        values = signing.loads(token, salt=CURSOR_SALT)
+    except signing.BadSignature:
+        return None
+    if not isinstance(values, list) or len(values) != len(ordering):
+        return None
+    decoded = []
+    for value in values:
+        if isinstance(value, str):
+            value = parse_datetime(value) or value
+        decoded.append(value)
+    return decoded
+
+
+def _keyset_filter(ordering, values, reverse=False):
+    """(a, b) < (x, y) のような行の比較を、ORとANDの組み合わせで表す"""
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip('-')
+        descending = field.startswith('-') != reverse
+        lookup = '{}__{}'.format(name, 'lt' if descending else 'gt')
+        term = Q(**{lookup: values[i]})
+        for prev_field, prev_value in zip(ordering[:i], values[:i]):
+            term &= Q(**{prev_field.lstrip('-'): prev_value})
+        condition |= term
+    return condition
+
+
+class KeysetPage:
+    """OFFSETを使わないページ。テンプレートからはpage_objとして使う"""
+    is_keyset = True
+
+    def __init__(self, object_list, ordering, has_next, has_previous):
+        self.object_list = object_list
+        self.ordering = ordering
+        self.has_next_page = has_next
+        self.has_previous_page = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.has_next_page
+
+    def has_previous(self):
+        return self.has_previous_page
+
+    def has_other_pages(self):
+        return self.has_next_page or self.has_previous_page
+
+    @property
+    def next_cursor(self):
+        if self.has_next_page and self.object_list:
+            return encode_cursor(self.object_list[-1], self.ordering)
+        return None
+
+    @property
+    def previous_cursor(self):
+        if self.has_previous_page and self.object_list:
+            return encode_cursor(self.object_list[0], self.ordering)
+        return None
+
+
+def paginate_keyset(queryset, ordering, per_page, after=None, before=None):
+    """orderingの値をキーにしてページを切り出す
+
+    afterを渡すとその次のページ、beforeを渡すとその前のページを返す。
+    orderingの最後には一意な列(idなど)を含めること。
+    """
+    after = decode_cursor(after, ordering) if after else None
+    before = decode_cursor(before, ordering) if before else None
+
+    if before is not None:
+        reversed_ordering = [
+            field.lstrip('-') if field.startswith('-') else '-' + field
+            for field in ordering]
+        rows = list(queryset.filter(_keyset_filter(ordering, before, reverse=True))
+                    .order_by(*reversed_ordering)[:per_page + 1])
+        has_previous = len(rows) > per_page
+        object_list = rows[:per_page][::-1]
+        return KeysetPage(object_list, ordering, True, has_previous)
+
+    if after is not None:
+        queryset = queryset.filter(_keyset_filter(ordering, after))
+    rows = list(queryset.order_by(*ordering)[:per_page + 1])
+    return KeysetPage(rows[:per_page], ordering, len(rows) > per_page,
+                      after is not None)
+
+
+class KeysetPaginationMixin:
+    """ListViewのページ分割をキーセット方式にする
+
+    ?after=カーソル で次のページ、?before=カーソル で前のページを表示する。
+    COUNTやOFFSETを使わないので、何ページ目でも同じ速さで表示できる。
+    """
+    keyset_ordering = ('-id',)
+
+    def paginate_keyset(self, queryset, page_size):
+        return paginate_keyset(
+            queryset, self.keyset_ordering, page_size,
+            after=self.request.GET.get('after'),
+            before=self.request.GET.get('before'))
+
+    def paginate_queryset(self, queryset, page_size):
+        page = self.paginate_keyset(queryset, page_size)
+        return (None, page, page.object_list, page.has_other_pages())
+
+
+def estimate_count(queryset):
+    """テーブルの統計(pg_class.reltuples)から行数を見積もる。見積もれないときはNone
+
+    絞り込みや検索をしたクエリセットは見積もりが大きく外れるので、Noneを返して正確に数えさせる。
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql' or queryset.query.where:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+            [connection.ops.quote_name(queryset.model._meta.db_table)])
+        row = cursor.fetchone()
+    # 一度もANALYZEされていないテーブルは-1になる
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """絞り込みのない一覧で件数が多いときは、COUNT(*)の代わりに見積もりの件数を使うPaginator
+
+    見積もれないときや、見積もりがestimate_thresholdより少ないときは正確に数える。
+    """
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        estimate = None
+        if hasattr(self.object_list, 'query'):
+            estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < self.estimate_threshold:
+            return super().count
+        return estimate
@@ -0,0 +1,154 @@
+import datetime
+from collections import defaultdict
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import DailyCategorySales, DailyPostSales, PriceHistory
+
+
+TOP_POSTS_NUM = 10
+
+
+def _day_range(since, until):
+    """日付の範囲[since, until)を、現在のタイムゾーンの日時の範囲にする"""
+    tz = timezone.get_current_timezone()
+    return (timezone.make_aware(datetime.datetime.combine(since, datetime.time.min), tz),
+            timezone.make_aware(datetime.datetime.combine(until, datetime.time.min), tz))
+
+
+def _add_postgresql(date, post_id, category_id, revenue):
+    """記事とカテゴリの集計行への加算を、1つのSQL文で行う"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'WITH post_sales AS ('
+            ' INSERT INTO {post} (date, post_id, count, revenue)'
+            ' VALUES (%(date)s, %(post)s, 1, %(revenue)s)'
+            ' ON CONFLICT (date, post_id) DO UPDATE'
+            ' SET count = {post}.count + 1, revenue = {post}.revenue + EXCLUDED.revenue'
+            ') INSERT INTO {category} (date, category_id, count, revenue)'
+            ' VALUES (%(date)s, %(category)s, 1, %(revenue)s)'
+            ' ON CONFLICT (date, category_id) DO UPDATE'
+            ' SET count = {category}.count + 1,'
+            ' revenue = {category}.revenue + EXCLUDED.revenue'.format(
+                post=DailyPostSales._meta.db_table,
+                category=DailyCategorySales._meta.db_table),
+            {'date': date, 'post': post_id, 'category': category_id,
+             'revenue': revenue})
+
+
+def _update(model, lookup, count, revenue):
+    return model.objects.filter(**lookup).update(
+        count=F('count') + count, revenue=F('revenue') + revenue)
+
+
+def _add_orm(model, lookup, revenue):
+    if _update(model, lookup, 1, revenue):
+        return
+    try:
+        # 同じ日の最初の購入が同時に来たときは、一意制約で片方が失敗する
+        with transaction.atomic():
+            model.objects.create(count=1, revenue=revenue, **lookup)
+    except IntegrityError:
+        _update(model, lookup, 1, revenue)
+
+
+def record_purchase(purchase):
+    """購入1件を日ごとの集計に加算する。金額とカテゴリは購入に記録したもの"""
+    date = timezone.localdate(purchase.created_at)
+    if connection.vendor == 'postgresql':
+        _add_postgresql(date, purchase.post_id, purchase.category_id, purchase.amount)
+        return
+    with transaction.atomic():
+        _add_orm(DailyPostSales, {'date': date, 'post_id': purchase.post_id},
+                 purchase.amount)
+        _add_orm(DailyCategorySales, {'date': date, 'category_id': purchase.category_id},
+                 purchase.amount)
+
+
+def cancel_purchase(purchase):
+    """削除された購入を、加算したときと同じ金額とカテゴリで集計から引く
+
+    記事の削除で購入ごと消えるときにも呼ばれるので、集計行は新しく作らない。
+    """
+    date = timezone.localdate(purchase.created_at)
+    with transaction.atomic():
+        _update(DailyPostSales, {'date': date, 'post_id': purchase.post_id},
+                -1, -purchase.amount)
+        _update(DailyCategorySales, {'date': date, 'category_id': purchase.category_id},
+                -1, -purchase.amount)
+
+
+def _lock_purchases():
+    """トランザクションの終わりまで、PriceHistoryへの追加・削除を待たせる
+
+    購入とその集計への加算は同じトランザクションで行われるので(PriceHistory.save)、
+    ロックが取れた時点の購入はすべて集計に入っている。
+    SQLiteはデータベース全体のロックで同じことになるので何もしない。
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('LOCK TABLE {} IN SHARE MODE'.format(
+            connection.ops.quote_name(PriceHistory._meta.db_table)))
+
+
+def rebuild_sales(since, until):
+    """[since, until)の日の集計をPriceHistoryから作り直し、作った記事の集計行の数を返す
+
+    集計から書き込みまでの間は購入の追加・削除を待たせ、その加算・減算が消えないようにする。
+    """
+    start, end = _day_range(since, until)
+    with transaction.atomic():
+        _lock_purchases()
+        rows = (PriceHistory.objects.filter(created_at__gte=start, created_at__lt=end)
+                .annotate(date=TruncDate('created_at'))
+                .values('date', 'post_id', 'category_id')
+                .annotate(count=Count('pk'), revenue=Sum('amount'))
+                .order_by())
+
+        post_totals = defaultdict(lambda: [0, 0])
+        category_totals = defaultdict(lambda: [0, 0])
+        for row in rows:
+            for totals in (post_totals[row['date'], row['post_id']],
+                           category_totals[row['date'], row['category_id']]):
+                totals[0] += row['count']
+                totals[1] += row['revenue']
+
+        DailyPostSales.objects.filter(date__gte=since, date__lt=until).delete()
+        DailyCategorySales.objects.filter(date__gte=since, date__lt=until).delete()
+        DailyPostSales.objects.bulk_create([
+            DailyPostSales(date=date, post_id=post_id, count=count, revenue=revenue)
+            for (date, post_id), (count, revenue) in post_totals.items()
+        ], batch_size=1000)
+        DailyCategorySales.objects.bulk_create([
+            DailyCategorySales(
+                date=date, category_id=category_id, count=count, revenue=revenue)
+            for (date, category_id), (count, revenue) in category_totals.items()
+        ], batch_size=1000)
+    return len(post_totals)
+
+
+def sales_report(since, until):
+    """[since, until)の売上を集計表だけから作る"""
+    category_sales = DailyCategorySales.objects.filter(date__gte=since, date__lt=until)
+    post_sales = DailyPostSales.objects.filter(date__gte=since, date__lt=until)
+
+    daily = list(category_sales.values('date')
+                 .annotate(count=Sum('count'), revenue=Sum('revenue'))
+                 .order_by('-date'))
+    categories = list(category_sales.values('category_id', 'category__name')
+                      .annotate(count=Sum('count'), revenue=Sum('revenue'))
+                      .order_by('-revenue', 'category_id'))
+    top_posts = list(post_sales.values('post_id', 'post__title')
+                     .annotate(count=Sum('count'), revenue=Sum('revenue'))
+                     .order_by('-revenue', 'post_id')[:TOP_POSTS_NUM])
+    return {
+        'count': sum(row['count'] for row in daily),
+        'revenue': sum(row['revenue'] for row in daily),
+        'daily': daily,
+        'categories': categories,
+        'top_posts': top_posts,
+    }
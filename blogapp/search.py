@@ -0,0 +1,95 @@
+import html
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils.html import strip_tags
+
+from .models import Post, SearchToken
+
+
+TITLE_WEIGHT = 10
+
+_SEPARATOR = re.compile(r'[\s\W_]+')
+
+
+def normalize(text):
+    """HTMLタグを除き、全角半角や大文字小文字の違いをそろえる"""
+    text = html.unescape(strip_tags(text or ''))
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def _words(text):
+    return [word for word in _SEPARATOR.split(normalize(text)) if word]
+
+
+def tokenize(text):
+    """インデックス用に文字bi-gramに分割する
+
+    語の最後の文字は1文字のトークンにもする。どの文字も、その文字で始まる
+    トークンを持つので、1文字の検索語を前方一致で探せる。
+    """
+    tokens = []
+    for word in _words(text):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return tokens
+
+
+def query_tokens(freeword):
+    """検索語を(bi-gramのリスト, 1文字の語のリスト)に分ける"""
+    pairs, singles = set(), set()
+    for word in _words(freeword):
+        if len(word) == 1:
+            singles.add(word)
+        pairs.update(word[i:i + 2] for i in range(len(word) - 1))
+    return sorted(pairs), sorted(singles)
+
+
+def build_tokens(post):
+    scores = Counter()
+    for token in tokenize(post.title):
+        scores[token] += TITLE_WEIGHT
+    for token in tokenize(post.content):
+        scores[token] += 1
+    return [SearchToken(token=token, post_id=post.pk, score=score)
+            for token, score in scores.items()]
+
+
+def index_post(post):
+    """1記事分のインデックスを作り直す"""
+    with transaction.atomic():
+        SearchToken.objects.filter(post_id=post.pk).delete()
+        SearchToken.objects.bulk_create(build_tokens(post))
+
+
+def search_post_ids(freeword):
+    """全てのトークンを含む記事のidを、スコアの高い順に返すQuerySet
+
+    1文字の語は、その文字で始まるトークンがある記事に絞り込む。
+    """
+    pairs, singles = query_tokens(freeword)
+    if not (pairs or singles):
+        return SearchToken.objects.none().values_list('post_id', flat=True)
+
+    if pairs:
+        results = SearchToken.objects.filter(token__in=pairs)
+    else:
+        results = SearchToken.objects.filter(token__startswith=singles[0])
+    for token in singles:
+        results = results.filter(post_id__in=SearchToken.objects.filter(
+            token__startswith=token).values('post_id'))
+
+    results = (results.order_by().values('post_id')
+               .annotate(hits=Count('id'), rank=Sum('score')))
+    if pairs:
+        results = results.filter(hits=len(pairs))
+    return results.order_by('-rank', '-post_id').values_list('post_id', flat=True)
+
+
+def fetch_posts(post_ids):
+    """idの並び順を保ったまま記事を取得する"""
+    posts = Post.objects.in_bulk(list(post_ids))
+    return [posts[pk] for pk in post_ids if pk in posts]
@@ -1,9 +1,19 @@
 from django.conf import settings
-from django.core.mail import send_mail, EmailMessage
-from django.db.models.signals import post_save
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.template.loader import render_to_string
-from .models import Comment, Reply
+from sitemanage.models import SiteConfig
+from .models import Category, Comment, Like, Post, PriceHistory, Reply
+from .caches import (
+    bump_version, clear_liked_post_ids, clear_post_fragments, clear_purchased_post_ids,
+    mark_changed,
+    refresh_category_posts,
+)
+from .search import index_post
+from .mail import enqueue_mail
+from .images import schedule_post_thumbnail
+from .sales import cancel_purchase, record_purchase
 
 
 
@@ -23,7 +33,7 @@ def send_mail_to_author(sender, instance, created, **kwargs):
         message = render_to_string('blogapp/mail/comment_notify_message.txt', context, request)
         from_email = settings.DEFAULT_FROM_EMAIL
         recipient_list = [settings.DEFAULT_FROM_EMAIL]
-        send_mail(subject, message, from_email, recipient_list)
+        enqueue_mail(subject, message, from_email, recipient_list)
 
 
 @receiver(post_save, sender=Reply)
@@ -51,5 +61,149 @@ def send_mail_to_comment_user(sender, instance, created, **kwargs):
         # コメントした人がメールアドレスを入力してれば、返信があったことを知らせる
         if (comment.useremail or comment.mailadress) and not request.session.get(str(comment.pk)):
             recipient_list.extend([comment.useremail, comment.mailadress])
-        email = EmailMessage(subject, message, from_email, recipient_list)
-        email.send()
+        enqueue_mail(subject, message, from_email, recipient_list)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_category_cache(sender, instance, **kwargs):
+    """カテゴリ一覧のキャッシュを無効にする"""
+    bump_version('category')
+
+
+@receiver(post_save, sender=Post)
+def update_search_index(sender, instance, **kwargs):
+    """記事の検索インデックスを更新する。削除時はCASCADEで消える"""
+    index_post(instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_nav_category_cache(sender, instance, **kwargs):
+    """ナビバーのカテゴリ一覧のキャッシュを無効にする"""
+    bump_version('category_nav')
+
+
+@receiver(post_save, sender=PriceHistory)
+@receiver(post_delete, sender=PriceHistory)
+def clear_purchase_cache(sender, instance, **kwargs):
+    """購入済み記事のキャッシュを無効にする"""
+    clear_purchased_post_ids(instance.user_id)
+
+
+@receiver(post_save, sender=PriceHistory)
+def add_purchase_to_sales(sender, instance, created, **kwargs):
+    """日ごとの売上集計に加算する"""
+    if created:
+        record_purchase(instance)
+
+
+@receiver(post_delete, sender=PriceHistory)
+def remove_purchase_from_sales(sender, instance, **kwargs):
+    cancel_purchase(instance)
+
+
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+def clear_like_cache(sender, instance, **kwargs):
+    """いいねした記事のキャッシュを無効にする"""
+    clear_liked_post_ids(instance.user_id)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def clear_sitemap_cache(sender, instance, **kwargs):
+    """サイトマップのキャッシュを無効にし、Last-Modifiedを変える"""
+    bump_version('sitemap')
+    mark_changed('sitemap')
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def clear_post_fragment_cache(sender, instance, **kwargs):
+    """記事本文のキャッシュを削除し、カテゴリのサイドバーを作り直させる"""
+    clear_post_fragments(instance)
+    bump_version('post_sidebar')
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def clear_sidebar_cache(sender, instance, **kwargs):
+    """記事詳細のサイドバーにはカテゴリ名が出る"""
+    bump_version('post_sidebar')
+
+
+@receiver(pre_save, sender=Post)
+def remember_old_values(sender, instance, **kwargs):
+    """保存前のカテゴリとサムネイルを覚えておく"""
+    old = None
+    if instance.pk:
+        old = Post.objects.filter(pk=instance.pk).values_list(
+            'category_id', 'thumbnail').first()
+    if old is not None:
+        # カテゴリが変わった場合に、元のカテゴリのリストも作り直せるようにする
+        instance._old_category_id = old[0]
+    if old is None or old[1] != instance.thumbnail.name:
+        # 画像が変わったら古い縮小版は使わない
+        instance.thumbnail_widths = ''
+        instance._thumbnail_changed = bool(instance.thumbnail)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def update_category_posts(sender, instance, **kwargs):
+    """カテゴリごとの最新記事のリストを作り直す"""
+    category_ids = {instance.category_id, getattr(instance, '_old_category_id', None)}
+    for category_id in category_ids - {None}:
+        refresh_category_posts(category_id)
+
+
+@receiver(post_save, sender=Post)
+def make_thumbnail_variants(sender, instance, **kwargs):
+    """サムネイルが変わったら縮小版を作る"""
+    if getattr(instance, '_thumbnail_changed', False):
+        schedule_post_thumbnail(instance)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def mark_post_changed(sender, instance, **kwargs):
+    """記事の保存・削除で、一覧と記事のページの検証子を変える"""
+    mark_changed('site', 'post:{}'.format(instance.pk))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=SiteConfig)
+@receiver(post_delete, sender=SiteConfig)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def mark_site_changed(sender, instance, **kwargs):
+    """ナビバーとサイト設定は全ページに出る"""
+    mark_changed('site')
+
+
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+def mark_like_changed(sender, instance, **kwargs):
+    """いいね数と状態は、その記事のページと記事の一覧にだけ出る"""
+    mark_changed('post:{}'.format(instance.post_id), 'post_list')
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=PriceHistory)
+@receiver(post_delete, sender=PriceHistory)
+def mark_post_page_changed(sender, instance, **kwargs):
+    mark_changed('post:{}'.format(instance.post_id))
+
+
+@receiver(post_save, sender=Reply)
+@receiver(post_delete, sender=Reply)
+def mark_reply_changed(sender, instance, **kwargs):
+    post_id = Comment.objects.filter(pk=instance.comment_id).values_list(
+        'post_id', flat=True).first()
+    if post_id is not None:
+        mark_changed('post:{}'.format(post_id))
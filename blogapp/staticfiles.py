@@ -0,0 +1,94 @@
+import fnmatch
+import posixpath
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import AppDirectoriesFinder, FileSystemFinder
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+# 管理画面のCKEditorで使わないプラグイン。
+# ckeditor.jsのビルドにもCKEDITOR_CONFIGSのextraPluginsにも含まれず、読み込まれることがない
+UNUSED_CKEDITOR_PLUGINS = frozenset([
+    'adobeair', 'ajax', 'autoembed', 'autogrow', 'autolink', 'bbcode',
+    'codesnippetgeshi', 'devtools', 'divarea', 'docprops', 'embed', 'embedbase',
+    'embedsemantic', 'iframedialog', 'image2', 'mathjax', 'placeholder',
+    'sharedspace', 'sourcedialog', 'stylesheetparser', 'tableresize', 'uicolor',
+    'xml',
+])
+
+# 言語ファイルが見つからないときのCKEditorの既定の言語。
+# エディタ自体はウィジェットがLANGUAGE_CODEの言語で開く
+CKEDITOR_FALLBACK_LANGUAGE = 'en'
+
+# ブラウザから読まれないドキュメントやビルド設定
+PRUNED_PATTERNS = (
+    'ckeditor/ckeditor/build-config.js',
+    'ckeditor/*/README*',
+    'ckeditor/*/CHANGES*',
+    'ckeditor/*/CHANGELOG*',
+    'ckeditor/*/readme.md',
+    'ckeditor/*.txt',
+)
+
+
+def _ckeditor_option(name, default):
+    return {config.get(name, default)
+            for config in getattr(settings, 'CKEDITOR_CONFIGS', {}).values()}
+
+
+def is_pruned(path):
+    """collectstaticで集めないファイルならTrue"""
+    path = path.replace('\\', '/')
+    parts = path.split('/')
+    if parts[:2] != ['ckeditor', 'ckeditor']:
+        return False
+    if any(fnmatch.fnmatchcase(path, pattern) for pattern in PRUNED_PATTERNS):
+        return True
+
+    section = parts[2] if len(parts) > 3 else None
+    if section == 'plugins' and parts[3] in UNUSED_CKEDITOR_PLUGINS:
+        return True
+    if section == 'skins':
+        return parts[3] not in _ckeditor_option('skin', 'moono-lisa')
+    if 'lang' in parts[2:-1] and parts[-1].endswith('.js'):
+        languages = {settings.LANGUAGE_CODE, CKEDITOR_FALLBACK_LANGUAGE}
+        return posixpath.splitext(parts[-1])[0] not in languages
+    if parts[2:6] == ['plugins', 'codesnippet', 'lib', 'highlight'] and parts[6:7] == ['styles']:
+        themes = _ckeditor_option('codeSnippet_theme', 'default')
+        return posixpath.splitext(parts[-1])[0] not in themes
+    return False
+
+
+class PrunedFinderMixin:
+    """is_prunedのファイルを、collectstaticからも開発サーバーからも見えなくする"""
+
+    def find(self, path, all=False):
+        if is_pruned(path):
+            return []
+        return super().find(path, all=all)
+
+    def list(self, ignore_patterns):
+        for path, storage in super().list(ignore_patterns):
+            if not is_pruned(path):
+                yield path, storage
+
+
+class PrunedFileSystemFinder(PrunedFinderMixin, FileSystemFinder):
+    pass
+
+
+class PrunedAppDirectoriesFinder(PrunedFinderMixin, AppDirectoriesFinder):
+    pass
+
+
+class CompressedManifestStorage(CompressedManifestStaticFilesStorage):
+    """ファイル名に内容のハッシュを付け、gzipとbrotliの圧縮版も書き出すストレージ
+
+    CKEditorはプラグインをハッシュの無い名前で読み込むので、元のファイルも残す。
+    """
+
+    def stored_name(self, name):
+        # collectstatic前(テストなど)はmanifestが無いので、元の名前で配信する
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
@@ -0,0 +1,28 @@
+from django import template
+
+from blogapp.caches import liked_post_ids, purchased_post_ids
+from blogapp.images import variant_url
+
+register = template.Library()
+
+
+@register.filter
+def purchased_by(post, user):
+    """{% if object|purchased_by:user %} でユーザーが記事を購入済みか調べる"""
+    return post.pk in purchased_post_ids(user)
+
+
+@register.filter
+def liked_by(post, user):
+    """{% if item|liked_by:user %} でユーザーがいいね済みか調べる。一覧でもクエリは1回"""
+    return post.pk in liked_post_ids(user)
+
+
+@register.filter
+def srcset(post, ext='jpg'):
+    """{{ post|srcset:'webp' }} でサムネイルの縮小版のsrcsetを返す。未作成なら空文字"""
+    if not post.thumbnail or not post.thumbnail_widths:
+        return ''
+    return ', '.join(
+        '{} {}w'.format(variant_url(post.thumbnail.name, width, ext), width)
+        for width in post.thumbnail_widths.split(','))
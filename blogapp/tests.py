@@ -1,3 +1,1064 @@
-from django.test import TestCase
+import datetime
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.contrib.staticfiles import finders
+from django.core.management import call_command
+from django.core import mail as django_mail
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.mail.backends.locmem import EmailBackend as LocmemEmailBackend
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from . import caches as blog_caches
+from .images import generate_variants, variant_name
+from .mail import MAX_ATTEMPTS, enqueue_mail, send_queued_mail
+from .sales import sales_report
+from .search import query_tokens, search_post_ids, tokenize
+from .staticfiles import is_pruned
+from .templatetags.blog_tags import srcset
+from .uploads import HashingTemporaryFileUploadHandler, make_thumbnail, referenced_uploads
+from .pagination import EstimatedCountPaginator, estimate_count, paginate_keyset
+from .models import (
+    Category, Comment, DailyCategorySales, DailyPostSales, Like, Post, PriceHistory, QueuedMail,
+    Reply, User,
+)
+from .timing import stats as timing_stats
+
+
+def app_queries(queries):
+    """DatabaseCacheの読み書き(テーブルへのクエリとそのSAVEPOINT)を除いたクエリ"""
+    return [q for q in queries
+            if '_cache"' not in q['sql'] and 'SAVEPOINT' not in q['sql']]
+
+
+class PostDetailQueryTest(TestCase):
+    """記事詳細ページのクエリ数が、コメント数や記事数で増えないことを確認する"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('author@example.com', 'password')
+        cls.category = Category.objects.create(name='カテゴリ', name_en='category')
+        posts = [
+            Post.objects.create(
+                author=cls.user, title='記事{}'.format(i), content='<p>本文</p>',
+                category=cls.category, thumbnail='images/test.jpg')
+            for i in range(10)]
+        cls.post = posts[0]
+        comments = Comment.objects.bulk_create([
+            Comment(post=cls.post, author='名前', text='コメント{}'.format(i))
+            for i in range(30)])
+        Reply.objects.bulk_create([
+            Reply(comment=comment, author='名前', text='返信')
+            for comment in Comment.objects.filter(post=cls.post)])
+
+    def setUp(self):
+        cache.clear()
+        caches['fragments'].clear()
+        Site.objects.clear_cache()
+        # 起動直後のワーカーと同じ状態にする
+        blog_caches._memo.clear()
+        self.url = reverse('blogapp:post_detail', args=[self.post.pk])
+
+    def test_cold_cache(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '記事9')
+        # 更新日時、サイト、記事、コメント、返信、サイト設定、ナビバー、サイドバー
+        self.assertEqual(len(app_queries(queries)), 8)
+
+    def test_warm_cache(self):
+        self.client.get(self.url)
+        # 更新日時、記事、コメント、返信。
+        # キャッシュはどれもプロセス内のメモリから返るので、キャッシュのテーブルは読まない
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'class="comment"', count=20)
+
+    def test_purchase_and_refund_update_page(self):
+        buyer = User.objects.create_user('buyer@example.com', 'password')
+        self.client.force_login(buyer)
+        thanks = 'この記事には寄付済みです'
+        # 購入済みの記事idをキャッシュに載せておく
+        self.assertNotContains(self.client.get(self.url), thanks)
+        self.assertEqual(blog_caches.purchased_post_ids(User.objects.get(pk=buyer.pk)), frozenset())
+
+        purchase = PriceHistory.objects.create(post=self.post, user=buyer, stripe_id='ch_test')
+        self.assertContains(self.client.get(self.url), thanks)
+        self.assertEqual(blog_caches.purchased_post_ids(User.objects.get(pk=buyer.pk)),
+                         frozenset([self.post.pk]))
+
+        purchase.delete()
+        self.assertNotContains(self.client.get(self.url), thanks)
+        self.assertEqual(blog_caches.purchased_post_ids(User.objects.get(pk=buyer.pk)), frozenset())
+
+    def test_load_more_comments(self):
+        response = self.client.get(self.url)
+        cursor = response.context['comment_page'].next_cursor
+        self.assertContains(response, 'id="more-comments"')
+        self.assertContains(response, 'data-cursor="{}"'.format(cursor))
+
+        url = reverse('blogapp:comment_page', args=[self.post.pk])
+        # 記事、コメント、返信
+        with self.assertNumQueries(3):
+            data = self.client.get(url, {'cursor': cursor}).json()
+        self.assertIsNone(data['next_cursor'])
+        self.assertEqual(data['html'].count('class="comment"'), 10)
+        self.assertEqual(data['html'].count('class="reply'), 10)
+
+        # 1ページ目と重ならず、合わせて全件になる
+        first = re.findall(r'コメント\d+', response.content.decode())
+        rest = re.findall(r'コメント\d+', data['html'])
+        self.assertEqual(sorted(first + rest),
+                         sorted('コメント{}'.format(i) for i in range(30)))
+
+    def test_comment_page_without_cursor(self):
+        url = reverse('blogapp:comment_page', args=[self.post.pk])
+        data = self.client.get(url, {'cursor': 'garbage'}).json()
+        self.assertEqual(data['html'].count('class="comment"'), 20)
+        self.assertTrue(data['next_cursor'])
+        self.assertEqual(self.client.get(
+            reverse('blogapp:comment_page', args=[0])).status_code, 404)
+
+
+class PostFragmentCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('author@example.com', 'password')
+        cls.category = Category.objects.create(name='カテゴリ', name_en='category')
+        cls.post = Post.objects.create(
+            author=user, title='古いタイトル', content='<p>本文</p>',
+            category=cls.category, thumbnail='images/test.jpg')
+
+    def setUp(self):
+        cache.clear()
+        caches['fragments'].clear()
+
+    def test_edits_replace_cached_fragments(self):
+        url = reverse('blogapp:post_detail', args=[self.post.pk])
+        self.assertContains(self.client.get(url), '古いタイトル')
+
+        # updated_atは変わらなくても、保存すれば新しい内容になる
+        self.post.title = '新しいタイトル'
+        self.post.save()
+        self.category.name = '新しいカテゴリ'
+        self.category.save()
+        response = self.client.get(url)
+        self.assertContains(response, '新しいタイトル')
+        self.assertNotContains(response, '古いタイトル')
+        self.assertContains(response, '新しいカテゴリ')
+
+
+class ConditionalGetTest(TestCase):
+    """変更が無ければ304を返し、変更があれば描画し直すことを確認する"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('author@example.com', 'password')
+        cls.category = Category.objects.create(name='カテゴリ', name_en='category')
+        cls.post = Post.objects.create(
+            author=cls.user, title='記事', content='<p>本文</p>',
+            category=cls.category, thumbnail='images/test.jpg')
+        cls.other = Post.objects.create(
+            author=cls.user, title='他の記事', content='<p>本文</p>',
+            category=cls.category, thumbnail='images/test.jpg')
+
+    def setUp(self):
+        cache.clear()
+        caches['fragments'].clear()
+        self.urls = [
+            reverse('blogapp:index'),
+            reverse('blogapp:post_list'),
+            reverse('blogapp:post_detail', args=[self.post.pk]),
+            reverse('blogapp:category_detail', args=['category']),
+        ]
+
+    def revalidate(self, url):
+        etag = self.client.get(url)['ETag']
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_not_modified(self):
+        for url in self.urls:
+            etag = self.client.get(url)['ETag']
+            # 更新日時の集計だけで判定し、件数は数えない
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304, url)
+            self.assertEqual(len(queries), 1, url)
+            self.assertNotIn('COUNT(', queries[0]['sql'].upper())
+
+    def test_if_modified_since(self):
+        url = self.urls[0]
+        last_modified = self.client.get(url)['Last-Modified']
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_changed_after_comment(self):
+        url = self.urls[2]
+        etag = self.client.get(url)['ETag']
+        Comment.objects.bulk_create([
+            Comment(post=self.post, author='名前', text='コメント')])
+        # bulk_createはシグナルを送らないので、保存で変更を記録する
+        Comment.objects.get().save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        # 他の記事のページには影響しない
+        other = reverse('blogapp:post_detail', args=[self.other.pk])
+        self.assertEqual(self.revalidate(other).status_code, 304)
+
+    def test_changed_after_delete(self):
+        etags = [self.client.get(url)['ETag'] for url in self.urls[:2]]
+        # setUpTestDataのオブジェクトは他のテストと共有なので、読み直して消す
+        Post.objects.get(pk=self.other.pk).delete()
+        for url, etag in zip(self.urls[:2], etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, url)
+
+    def test_sitemap(self):
+        url = reverse('sitemap')
+        etag = self.client.get(url)['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([q for q in queries if 'COUNT(' in q['sql'].upper()])
+
+        self.post.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_sitemap_if_modified_since(self):
+        url = reverse('sitemap')
+        deleted = Post.objects.create(
+            author=self.user, title='消す記事', content='<p>本文</p>', category=self.category)
+        last_modified = self.client.get(url)['Last-Modified']
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+
+        # updated_atを変えない編集や削除でも、Last-Modifiedが進む
+        later = timezone.now() + datetime.timedelta(seconds=2)
+        for change in (self.post.save, deleted.delete):
+            with mock.patch.object(blog_caches.timezone, 'now', return_value=later):
+                change()
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, 200)
+            last_modified = response['Last-Modified']
+            later += datetime.timedelta(seconds=2)
+
+    def test_changed_after_like(self):
+        other = reverse('blogapp:post_detail', args=[self.other.pk])
+        etags = [self.client.get(url)['ETag'] for url in self.urls + [other]]
+        Like.objects.create(user=self.user, post=self.post)
+        for url, etag in zip(self.urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, url)
+        # いいねされていない記事のページは304のまま
+        response = self.client.get(other, HTTP_IF_NONE_MATCH=etags[-1])
+        self.assertEqual(response.status_code, 304)
+
+    def test_viewer_changes_etag(self):
+        url = self.urls[0]
+        etag = self.client.get(url)['ETag']
+        self.client.force_login(self.user)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Last-Modified', response)
+        self.assertEqual(self.revalidate(url).status_code, 304)
+
+
+class QueryPlanTest(TestCase):
+    """各ページのクエリをEXPLAINし、インデックスを使わない全件走査が無いことを確認する"""
+
+    # (URL名, 引数, 全件読むのが仕様のテーブル)
+    pages = [
+        ('blogapp:index', [], {'blogapp_category'}),
+        ('blogapp:post_list', [], {'blogapp_category'}),
+        ('blogapp:post_detail', ['post'], {'blogapp_category'}),
+        ('blogapp:category_detail', ['category'], {'blogapp_category'}),
+        ('blogapp:category_list', [], {'blogapp_category'}),
+        ('blogapp:like_list', [], {'blogapp_category'}),
+        ('blogapp:search', [], {'blogapp_category'}),
+        ('blogapp:comment_page', ['post'], set()),
+        # サイトマップは全記事を載せる
+        ('sitemap', [], {'blogapp_post'}),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('author@example.com', 'password')
+        categories = [
+            Category.objects.create(name='カテゴリ{}'.format(i), name_en='category{}'.format(i))
+            for i in range(3)]
+        posts = [
+            Post.objects.create(
+                author=cls.user, title='記事{}'.format(i), content='<p>本文</p>',
+                category=categories[i % 3], thumbnail='images/test.jpg')
+            for i in range(30)]
+        cls.post = posts[0]
+        cls.category = categories[0]
+        Like.objects.bulk_create([Like(user=cls.user, post=post) for post in posts[:10]])
+        Comment.objects.bulk_create([
+            Comment(post=cls.post, author='名前', text='コメント{}'.format(i))
+            for i in range(5)])
+        Reply.objects.bulk_create([
+            Reply(comment=comment, author='名前', text='返信')
+            for comment in Comment.objects.all()])
+
+    def setUp(self):
+        cache.clear()
+        caches['fragments'].clear()
+        self.client.force_login(self.user)
+
+    def explain(self, sql):
+        vendor = connection.vendor
+        with connection.cursor() as cursor:
+            if vendor == 'sqlite':
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+                return [row[-1] for row in cursor.fetchall()]
+            if vendor == 'postgresql':
+                # 行数が少ないと全件走査が選ばれるので、使えるインデックスがあれば使わせる
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('EXPLAIN ' + sql)
+                return [row[0] for row in cursor.fetchall()]
+        self.skipTest('EXPLAIN is not supported on {}'.format(vendor))
+
+    def full_scans(self, plan):
+        tables = set(connection.introspection.table_names())
+        for line in plan:
+            # SQLite: "SCAN blogapp_post"(インデックスを使うときは USING INDEX が付く)
+            # PostgreSQL: "Seq Scan on blogapp_post"
+            match = (re.search(r'\bSCAN (?:TABLE )?(\w+)\b', line)
+                     or re.search(r'Seq Scan on (\w+)', line))
+            if match and match.group(1) in tables and 'USING' not in line:
+                yield match.group(1)
+
+    def url(self, name, args):
+        values = {'post': self.post.pk, 'category': self.category.name_en}
+        url = reverse(name, args=[values[arg] for arg in args])
+        if name == 'blogapp:search':
+            url += '?freeword=記事'
+        return url
+
+    def test_no_full_scans(self):
+        for name, args, allowed in self.pages:
+            url = self.url(name, args)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            for query in queries.captured_queries:
+                if not query['sql'].startswith('SELECT'):
+                    continue
+                scans = set(self.full_scans(self.explain(query['sql']))) - allowed
+                self.assertFalse(
+                    scans, '{}: {} のクエリが全件走査しています\n{}'.format(
+                        url, ', '.join(sorted(scans)), query['sql']))
+
+
+class ServerTimingTest(TestCase):
+
+    def setUp(self):
+        timing_stats.clear()
+
+    def test_header_and_stats(self):
+        user = User.objects.create_superuser('admin@example.com', 'password')
+        self.client.force_login(user)
+        response = self.client.get(reverse('blogapp:category_list'))
+        self.assertRegex(response['Server-Timing'], r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn('tpl;dur=', response['Server-Timing'])
+
+        response = self.client.get(reverse('blogapp:performance_stats'))
+        self.assertContains(response, 'blogapp:category_list')
+
+    def test_header_only_for_staff(self):
+        url = reverse('blogapp:category_list')
+        response = self.client.get(url)
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(timing_stats.summary()[0]['name'], 'blogapp:category_list')
+
+        self.client.force_login(User.objects.create_user('user@example.com', 'password'))
+        self.assertNotIn('Server-Timing', self.client.get(url))
+        with self.settings(SERVER_TIMING_PUBLIC=True):
+            self.assertIn('Server-Timing', self.client.get(url))
+
+
+class LikeToggleTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('author@example.com', 'password')
+        category = Category.objects.create(name='カテゴリ', name_en='category')
+        cls.post = Post.objects.create(
+            author=cls.user, title='記事', content='<p>本文</p>',
+            category=category, thumbnail='images/test.jpg')
+
+    def test_toggle(self):
+        self.client.force_login(self.user)
+        url = reverse('blogapp:like_toggle', args=[self.post.pk])
+        self.assertEqual(self.client.post(url).json(), {'liked': True, 'like_num': 1})
+        self.assertEqual(self.client.post(url).json(), {'liked': False, 'like_num': 0})
+        self.assertFalse(Like.objects.exists())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_num, 0)
+
+    def test_list_pages_show_like_state(self):
+        self.client.force_login(self.user)
+        self.client.post(reverse('blogapp:like_toggle', args=[self.post.pk]))
+        urls = [
+            reverse('blogapp:index'),
+            reverse('blogapp:post_list'),
+            reverse('blogapp:category_detail', args=['category']),
+        ]
+        etags = {}
+        for url in urls:
+            response = self.client.get(url)
+            self.assertContains(response, 'fas fa-heart', count=1)
+            etags[url] = response['ETag']
+        response = self.client.get(reverse('blogapp:post_detail', args=[self.post.pk]))
+        self.assertContains(response, 'お気に入りから外す')
+
+        self.client.post(reverse('blogapp:like_toggle', args=[self.post.pk]))
+        # 前のETagで聞いても304にならず、描画し直す
+        for url in urls:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+            self.assertContains(response, 'far fa-heart', count=1)
+
+    def test_missing_post(self):
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('blogapp:like_toggle', args=[0]))
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(Like.objects.exists())
+
+    def test_login_required(self):
+        response = self.client.post(reverse('blogapp:like_toggle', args=[self.post.pk]))
+        self.assertEqual(response.status_code, 401)
+
+    def test_recount_likes(self):
+        other = User.objects.create_user('other@example.com', 'password')
+        posts = [self.post] + [
+            Post.objects.create(
+                author=self.user, title='記事{}'.format(i), content='<p>本文</p>',
+                category=self.post.category)
+            for i in range(2)]
+        Like.objects.bulk_create([
+            Like(user=self.user, post=posts[0]), Like(user=other, post=posts[0]),
+            Like(user=self.user, post=posts[1])])
+        Post.objects.filter(pk=posts[0].pk).update(like_num=5)
+        Post.objects.filter(pk=posts[2].pk).update(like_num=1)
+
+        out = StringIO()
+        call_command('recount_likes', '--chunk-size=2', stdout=out)
+        self.assertIn('3件', out.getvalue())
+        self.assertEqual(
+            list(Post.objects.filter(pk__in=[post.pk for post in posts])
+                 .order_by('pk').values_list('like_num', flat=True)),
+            [2, 1, 0])
+
+
+class WarmUpTest(TestCase):
+
+    def test_missing_manifest_entry_does_not_stop_worker(self):
+        from django.contrib.staticfiles.storage import staticfiles_storage
+        from project import warmup
+
+        missing = ValueError("Missing staticfiles manifest entry for 'css/style.css'")
+        with mock.patch.object(staticfiles_storage, 'url', side_effect=missing), \
+                mock.patch.object(warmup.connections, 'close_all'), \
+                mock.patch.object(warmup, 'prime_caches') as prime_caches, \
+                self.assertLogs('project.warmup', 'ERROR'):
+            warmup.warm_up()
+        prime_caches.assert_called_once_with()
+
+
+class StaticFilesPruneTest(TestCase):
+
+    def test_unused_ckeditor_files_are_pruned(self):
+        self.assertTrue(is_pruned('ckeditor/ckeditor/plugins/mathjax/plugin.js'))
+        self.assertTrue(is_pruned('ckeditor/ckeditor/plugins/youtube/lang/fr.js'))
+        self.assertTrue(is_pruned('ckeditor/ckeditor/skins/moono-lisa/editor.css'))
+        self.assertFalse(is_pruned('ckeditor/ckeditor/plugins/youtube/lang/ja.js'))
+        self.assertFalse(is_pruned('ckeditor/ckeditor/plugins/codesnippet/plugin.js'))
+        self.assertFalse(is_pruned('admin/js/vendor/jquery/jquery.js'))
+
+    def test_finders(self):
+        self.assertFalse(finders.find('ckeditor/ckeditor/plugins/mathjax/plugin.js'))
+        self.assertTrue(finders.find('ckeditor/ckeditor/ckeditor.js'))
+        # 自前のconfig.jsがパッケージのものより優先される
+        self.assertTrue(finders.find('ckeditor/ckeditor/config.js').startswith(
+            os.path.join(settings.BASE_DIR, 'static')))
+
+
+class KeysetPaginationTest(TestCase):
+    ordering = ('-updated_at', '-id')
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('author@example.com', 'password')
+        category = Category.objects.create(name='カテゴリ', name_en='category')
+        now = timezone.now()
+        # 4件はupdated_atが同じ。idの順で並ぶ
+        for i in range(7):
+            Post.objects.create(
+                author=user, title='記事{}'.format(i), content='<p>本文</p>',
+                category=category, updated_at=now - datetime.timedelta(days=max(i - 3, 0)))
+        cls.expected = list(Post.objects.order_by(*cls.ordering).values_list('pk', flat=True))
+
+    def ids(self, page):
+        return [post.pk for post in page]
+
+    def test_round_trip(self):
+        pages = [paginate_keyset(Post.objects.all(), self.ordering, 3)]
+        while pages[-1].has_next():
+            pages.append(paginate_keyset(
+                Post.objects.all(), self.ordering, 3, after=pages[-1].next_cursor))
+        self.assertEqual([self.ids(page) for page in pages],
+                         [self.expected[:3], self.expected[3:6], self.expected[6:]])
+        self.assertFalse(pages[0].has_previous())
+
+        back = paginate_keyset(
+            Post.objects.all(), self.ordering, 3, before=pages[2].previous_cursor)
+        self.assertEqual(self.ids(back), self.expected[3:6])
+        back = paginate_keyset(Post.objects.all(), self.ordering, 3, before=back.previous_cursor)
+        self.assertEqual(self.ids(back), self.expected[:3])
+        self.assertFalse(back.has_previous())
+
+    def test_ties_are_broken_by_id(self):
+        tied = self.expected[:4]
+        self.assertEqual(tied, sorted(tied, reverse=True))
+        page = paginate_keyset(Post.objects.all(), self.ordering, 2)
+        page = paginate_keyset(Post.objects.all(), self.ordering, 2, after=page.next_cursor)
+        self.assertEqual(self.ids(page), tied[2:])
+
+    def test_tampered_cursor_shows_first_page(self):
+        cursor = paginate_keyset(Post.objects.all(), self.ordering, 5).next_cursor
+        for value in (cursor[:-1] + ('A' if cursor[-1] != 'A' else 'B'), 'garbage'):
+            response = self.client.get(reverse('blogapp:post_list'), {'after': value})
+            self.assertEqual(self.ids(response.context['page_obj']), self.expected[:5])
+            self.assertFalse(response.context['page_obj'].has_previous())
+
+    def test_no_count_or_offset(self):
+        cursor = paginate_keyset(Post.objects.all(), self.ordering, 5).next_cursor
+        self.client.get(reverse('blogapp:post_list'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('blogapp:post_list'), {'after': cursor})
+        self.assertEqual(self.ids(response.context['page_obj']), self.expected[5:])
+        for query in queries:
+            self.assertNotIn('COUNT(', query['sql'].upper())
+            self.assertNotIn('OFFSET', query['sql'].upper())
+
+
+class AdminChangelistQueryTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin@example.com', 'password')
+        category = Category.objects.create(name='カテゴリ', name_en='category')
+        cls.posts = [
+            Post.objects.create(
+                author=cls.admin, title='記事{}'.format(i), content='<p>本文</p>',
+                category=category)
+            for i in range(3)]
+
+    def add_rows(self, start, stop):
+        users = User.objects.bulk_create(
+            User(email='user{}@example.com'.format(i)) for i in range(start, stop))
+        users = User.objects.filter(email__in=[user.email for user in users])
+        rows = [(i, user, self.posts[i % len(self.posts)]) for i, user in enumerate(users)]
+        Like.objects.bulk_create(Like(user=user, post=post) for _, user, post in rows)
+        PriceHistory.objects.bulk_create(
+            PriceHistory(user=user, post=post, stripe_id='ch_{}'.format(user.pk),
+                         amount=post.price, category_id=post.category_id)
+            for _, user, post in rows)
+        Comment.objects.bulk_create(
+            Comment(post=post, author='名前', text='コメント{}'.format(i))
+            for i, _, post in rows)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.client.force_login(self.admin)
+        urls = [reverse('admin:blogapp_{}_changelist'.format(name))
+                for name in ('like', 'pricehistory', 'comment')]
+        self.add_rows(0, 2)
+        self.client.get(urls[0])
+        before = [self.count_queries(url) for url in urls]
+        self.add_rows(2, 12)
+        self.assertEqual([self.count_queries(url) for url in urls], before)
+
+    def test_filtered_changelist_counts_exactly(self):
+        self.add_rows(0, 12)
+        self.assertIsNone(estimate_count(Like.objects.filter(post=self.posts[0])))
+        paginator = EstimatedCountPaginator(
+            Like.objects.filter(post=self.posts[0]).order_by('pk'), 2)
+        paginator.estimate_threshold = 0
+        self.assertEqual(paginator.count, 4)
+
+        self.client.force_login(self.admin)
+        response = self.client.get(
+            reverse('admin:blogapp_like_changelist'), {'post__id__exact': self.posts[0].pk})
+        self.assertEqual(response.context['cl'].result_count, 4)
+
+    def test_estimate_from_table_statistics(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest('pg_class is only available on PostgreSQL')
+        self.add_rows(0, 12)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE blogapp_like')
+        self.assertEqual(estimate_count(Like.objects.all()), 12)
+
+
+class SalesRollupTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin@example.com', 'password')
+        cls.buyer = User.objects.create_user('buyer@example.com', 'password')
+        cls.category = Category.objects.create(name='カテゴリ', name_en='category')
+        cls.posts = [
+            Post.objects.create(
+                author=cls.admin, title='記事{}'.format(i), content='<p>本文</p>',
+                category=cls.category, price=price)
+            for i, price in enumerate((100, 500))]
+
+    def rollups(self):
+        return (
+            list(DailyPostSales.objects.order_by('date', 'post_id')
+                 .values_list('date', 'post_id', 'count', 'revenue')),
+            list(DailyCategorySales.objects.order_by('date', 'category_id')
+                 .values_list('date', 'category_id', 'count', 'revenue')),
+        )
+
+    def test_purchases_update_rollups(self):
+        yesterday = timezone.now() - datetime.timedelta(days=1)
+        for post, created_at in [(self.posts[0], yesterday), (self.posts[0], None),
+                                 (self.posts[0], None), (self.posts[1], None)]:
+            purchase = PriceHistory(post=post, user=self.buyer, stripe_id='ch_test')
+            if created_at:
+                purchase.created_at = created_at
+            purchase.save()
+        PriceHistory.objects.filter(post=self.posts[1]).delete()
+
+        today = timezone.localdate()
+        post_rows, category_rows = self.rollups()
+        self.assertEqual(post_rows, [
+            (today - datetime.timedelta(days=1), self.posts[0].pk, 1, 100),
+            (today, self.posts[0].pk, 2, 200),
+            (today, self.posts[1].pk, 0, 0),
+        ])
+        self.assertEqual(category_rows, [
+            (today - datetime.timedelta(days=1), self.category.pk, 1, 100),
+            (today, self.category.pk, 2, 200),
+        ])
+
+        # 作り直しても同じ集計になる(件数0の行は作られない)
+        call_command('rebuild_sales', stdout=StringIO())
+        self.assertEqual(self.rollups(), (post_rows[:2], category_rows))
+
+        report = sales_report(today - datetime.timedelta(days=6), today + datetime.timedelta(days=1))
+        self.assertEqual((report['count'], report['revenue']), (3, 300))
+        self.assertEqual(report['top_posts'][0]['post__title'], '記事0')
+
+    def test_refund_uses_amount_at_purchase(self):
+        purchase = PriceHistory.objects.create(
+            post=self.posts[0], user=self.buyer, stripe_id='ch_test')
+        PriceHistory.objects.create(post=self.posts[0], user=self.buyer, stripe_id='ch_test')
+        other = Category.objects.create(name='別のカテゴリ', name_en='other')
+        post = Post.objects.get(pk=self.posts[0].pk)
+        post.price = 300
+        post.category = other
+        post.save()
+        PriceHistory.objects.create(post=post, user=self.buyer, stripe_id='ch_test')
+        purchase.delete()
+
+        today = timezone.localdate()
+        post_rows, category_rows = self.rollups()
+        self.assertEqual(post_rows, [(today, self.posts[0].pk, 2, 400)])
+        self.assertEqual(category_rows, [
+            (today, self.category.pk, 1, 100),
+            (today, other.pk, 1, 300),
+        ])
+        call_command('rebuild_sales', stdout=StringIO())
+        self.assertEqual(self.rollups(), (post_rows, category_rows))
+
+    def test_purchase_and_rollup_share_a_transaction(self):
+        # 集計への加算が失敗したら購入も残らない。rebuild_salesはこれを前提にロックする
+        with mock.patch('blogapp.signals.record_purchase', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                PriceHistory.objects.create(
+                    post=self.posts[0], user=self.buyer, stripe_id='ch_test')
+        self.assertFalse(PriceHistory.objects.exists())
+
+    def test_dashboard(self):
+        PriceHistory.objects.create(post=self.posts[1], user=self.buyer, stripe_id='ch_test')
+        url = reverse('blogapp:sales_dashboard')
+        self.client.force_login(self.buyer)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.client.force_login(self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'days': 7})
+        self.assertContains(response, '1件、500円')
+        self.assertFalse([q for q in queries if 'pricehistory' in q['sql']])
+
+
+class RefusingEmailBackend(LocmemEmailBackend):
+    """SMTPサーバーが落ちているときのように、接続で失敗する"""
+
+    def open(self):
+        raise ConnectionRefusedError('connection refused')
+
+
+class QueuedMailTest(TestCase):
+
+    def test_enqueue_dedupes_recipients(self):
+        mail = enqueue_mail(
+            '件名\n改行', '本文', None,
+            ['a@example.com', '', 'a@example.com', 'b@example.com'])
+        self.assertEqual(mail.subject, '件名改行')
+        self.assertEqual(mail.recipient_list(), ['a@example.com', 'b@example.com'])
+        self.assertIsNone(enqueue_mail('件名', '本文', None, ['', None]))
+
+    def test_send(self):
+        mail = enqueue_mail('件名', '本文', 'from@example.com', ['a@example.com'])
+        self.assertEqual(send_queued_mail(), (1, 0))
+        self.assertEqual(len(django_mail.outbox), 1)
+        self.assertEqual(django_mail.outbox[0].to, ['a@example.com'])
+        mail.refresh_from_db()
+        self.assertEqual((mail.status, mail.attempts), (QueuedMail.STATUS_SENT, 1))
+        # 送信済みのメールは再送しない
+        self.assertEqual(send_queued_mail(), (0, 0))
+
+    @override_settings(EMAIL_BACKEND='blogapp.tests.RefusingEmailBackend')
+    def test_connection_failure_backs_off(self):
+        mails = [enqueue_mail('件名', '本文', None, ['a@example.com']) for _ in range(2)]
+        before = timezone.now()
+        self.assertEqual(send_queued_mail(), (0, 2))
+        for mail in mails:
+            mail.refresh_from_db()
+            self.assertEqual((mail.status, mail.attempts), (QueuedMail.STATUS_PENDING, 1))
+            self.assertIn('connection refused', mail.last_error)
+            self.assertGreaterEqual(mail.next_attempt_at, before + datetime.timedelta(seconds=60))
+        # 次回送信日時まで再送しない
+        self.assertEqual(send_queued_mail(), (0, 0))
+
+    @override_settings(EMAIL_BACKEND='blogapp.tests.RefusingEmailBackend')
+    def test_gives_up_after_max_attempts(self):
+        mail = enqueue_mail('件名', '本文', None, ['a@example.com'])
+        QueuedMail.objects.filter(pk=mail.pk).update(attempts=MAX_ATTEMPTS - 1)
+        send_queued_mail()
+        mail.refresh_from_db()
+        self.assertEqual((mail.status, mail.attempts), (QueuedMail.STATUS_FAILED, MAX_ATTEMPTS))
+
+
+class SearchTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('author@example.com', 'password')
+        category = Category.objects.create(name='カテゴリ', name_en='category')
+
+        def create(title, content):
+            return Post.objects.create(
+                author=user, title=title, content=content, category=category)
+
+        cls.weather = create('天気', '<p>明日は晴れ</p>')
+        cls.go = create('行く', '<p>Ｄｊａｎｇｏで天気を調べる</p>')
+        cls.other = create('料理', '<p>晴れの日の料理</p>')
+
+    def search(self, freeword):
+        return list(search_post_ids(freeword))
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('<b>ＡＢｃ</b> 天気'), ['ab', 'bc', 'c', '天気', '気'])
+        self.assertEqual(query_tokens('天気 a'), (['天気'], ['a']))
+
+    def test_single_character(self):
+        self.assertEqual(self.search('気'), [self.weather.pk, self.go.pk])
+        self.assertEqual(self.search('く'), [self.go.pk])
+
+    def test_all_tokens_required(self):
+        self.assertEqual(self.search('天気 django'), [self.go.pk])
+        self.assertEqual(self.search('晴れ 料理'), [self.other.pk])
+        self.assertEqual(self.search('天気 料理'), [])
+
+    def test_title_ranks_first(self):
+        # タイトルに含む記事が、本文だけに含む記事より先に来る
+        self.assertEqual(self.search('天気'), [self.weather.pk, self.go.pk])
+
+    def test_rebuild_keeps_index(self):
+        before = self.search('晴れ')
+        call_command('rebuild_search_index', '--chunk-size=1', stdout=StringIO())
+        self.assertEqual(self.search('晴れ'), before)
+
+
+@override_settings(
+    DEFAULT_FILE_STORAGE='django.core.files.storage.FileSystemStorage', MEDIA_URL='/media/',
+    THUMBNAIL_WIDTHS=(320, 640, 960))
+class ThumbnailTest(TransactionTestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def save_image(self, name, width):
+        buffer = BytesIO()
+        Image.new('RGB', (width, width // 2), 'white').save(buffer, 'JPEG')
+        return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+    def test_variants_are_not_upscaled(self):
+        name = self.save_image('images/small.jpg', 500)
+        self.assertEqual(generate_variants(name), [320, 500])
+        for width in (320, 500):
+            self.assertTrue(default_storage.exists(variant_name(name, width, 'webp')))
+        self.assertFalse(default_storage.exists(variant_name(name, 640, 'jpg')))
+
+        name = self.save_image('images/exact.jpg', 640)
+        self.assertEqual(generate_variants(name), [320, 640])
+
+    def test_srcset(self):
+        post = Post(thumbnail='images/test.jpg')
+        self.assertEqual(srcset(post), '')
+        post.thumbnail_widths = '320,500'
+        self.assertEqual(srcset(post, 'webp'), '{} 320w, {} 500w'.format(
+            default_storage.url('images/test_w320.webp'),
+            default_storage.url('images/test_w500.webp')))
+
+    def test_backfill_command(self):
+        user = User.objects.create_user('author@example.com', 'password')
+        category = Category.objects.create(name='カテゴリ', name_en='category')
+        # シグナルで縮小版が作られないようbulk_createで作る
+        Post.objects.bulk_create([
+            Post(author=user, title='記事', content='<p>本文</p>', category=category,
+                 thumbnail=self.save_image('images/backfill.jpg', 1000)),
+            Post(author=user, title='壊れた画像', content='<p>本文</p>', category=category,
+                 thumbnail=default_storage.save('images/broken.jpg', ContentFile(b'broken'))),
+        ])
+        out = StringIO()
+        with self.assertLogs('blogapp.images', 'ERROR'):
+            call_command('generate_thumbnails', '--workers=1', stdout=out)
+        self.assertIn('作成: 1件 失敗: 1件', out.getvalue())
+        self.assertEqual(
+            list(Post.objects.order_by('pk').values_list('thumbnail_widths', flat=True)),
+            ['320,640,960', ''])
+
+
+class CategoryListQueryTest(TestCase):
+    """カテゴリ一覧のクエリ数が、カテゴリ数で増えないことを確認する"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('author@example.com', 'password')
+
+    def setUp(self):
+        self.url = reverse('blogapp:category_list')
+
+    def add_categories(self, start, stop):
+        for i in range(start, stop):
+            category = Category.objects.create(
+                name='カテゴリ{}'.format(i), name_en='category{}'.format(i))
+            for j in range(7):
+                Post.objects.create(
+                    author=self.user, title='記事{}-{}'.format(i, j), content='<p>本文</p>',
+                    category=category)
+
+    def count_queries(self):
+        # 起動直後のワーカーと同じ状態にする
+        cache.clear()
+        Site.objects.clear_cache()
+        blog_caches._memo.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(app_queries(queries))
+
+    def test_query_count(self):
+        self.add_categories(0, 2)
+        # サイト、記事数、最新記事、サイト設定。ナビバーは一覧と同じリストを使う
+        self.assertEqual(self.count_queries(), 4)
+        self.add_categories(2, 6)
+        self.assertEqual(self.count_queries(), 4)
+        self.assertContains(self.client.get(self.url), '記事5-6')
+        # 2回目からはプロセス内のメモリから返る
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+
+class TwoLevelCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_hits_are_served_from_memory(self):
+        cache.set('key', 'value')
+        with self.assertNumQueries(0):
+            self.assertEqual(cache.get('key'), 'value')
+
+    def test_other_workers_see_changes_after_local_timeout(self):
+        cache.set('key', 'before')
+        # 他のワーカーが共有キャッシュに書き込んだ
+        caches['shared'].set('key', 'after')
+        self.assertEqual(cache.get('key'), 'before')
+        later = time.time() + settings.CACHE_LOCAL_TIMEOUT + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=later):
+            self.assertEqual(cache.get('key'), 'after')
+
+        caches['shared'].delete('key')
+        later += settings.CACHE_LOCAL_TIMEOUT + 1
+        with mock.patch('django.core.cache.backends.locmem.time.time', return_value=later):
+            self.assertIsNone(cache.get('key'))
+
+
+class NavCategoriesTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='カテゴリ', name_en='category')
+
+    def setUp(self):
+        cache.clear()
+        blog_caches._memo.clear()
+        blog_caches.stats.clear()
+
+    def names(self):
+        return [category.name for category in blog_caches.nav_categories()]
+
+    def test_memo_hit_costs_no_io(self):
+        self.assertEqual(self.names(), ['カテゴリ'])
+        with self.assertNumQueries(0), \
+                mock.patch.object(blog_caches, 'get_version') as get_version:
+            self.assertEqual(self.names(), ['カテゴリ'])
+        get_version.assert_not_called()
+        self.assertEqual(blog_caches.stats['nav_categories.miss'], 1)
+        self.assertEqual(blog_caches.stats['nav_categories.memo_hit'], 1)
+
+    def test_changes_from_other_workers(self):
+        self.names()
+        # 他のワーカーでカテゴリが追加され、世代番号が進んだ
+        Category.objects.bulk_create([Category(name='追加', name_en='added')])
+        cache.incr('blogapp:version:category_nav')
+        self.assertEqual(self.names(), ['カテゴリ'])
+
+        later = time.monotonic() + settings.CACHE_LOCAL_TIMEOUT + 1
+        with mock.patch.object(blog_caches.time, 'monotonic', return_value=later):
+            self.assertEqual(self.names(), ['カテゴリ', '追加'])
+        self.assertEqual(blog_caches.stats['nav_categories.miss'], 2)
+
+    def test_changes_in_this_worker(self):
+        self.names()
+        self.category.name = '新しい名前'
+        self.category.save()
+        self.assertEqual(self.names(), ['新しい名前'])
+
+    def test_performance_stats_page(self):
+        self.names()
+        admin = User.objects.create_superuser('admin@example.com', 'password')
+        self.client.force_login(admin)
+        response = self.client.get(reverse('blogapp:performance_stats'))
+        self.assertContains(response, 'nav_categories.miss')
+
+
+class UploadsTest(TestCase):
+
+    def setUp(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        self.storage = FileSystemStorage(location=location, base_url='/media/')
+        for target in ('ckeditor_uploader.views.storage',
+                       'blogapp.management.commands.gc_uploads.storage'):
+            patcher = mock.patch(target, self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch('blogapp.uploads.get_executor')
+        self.executor = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def image(self):
+        buffer = BytesIO()
+        Image.new('RGB', (100, 100), 'white').save(buffer, 'JPEG')
+        return buffer.getvalue()
+
+    def save(self, name, age_hours=0):
+        name = self.storage.save(name, ContentFile(b'data'))
+        mtime = time.time() - age_hours * 60 * 60
+        os.utime(self.storage.path(name), (mtime, mtime))
+        return name
+
+    def test_handler_hashes_while_streaming(self):
+        data = self.image()
+        handler = HashingTemporaryFileUploadHandler()
+        handler.new_file('upload', 'a.jpg', 'image/jpeg', len(data))
+        for start in range(0, len(data), 100):
+            handler.receive_data_chunk(data[start:start + 100], start)
+        uploaded = handler.file_complete(len(data))
+        self.assertEqual(uploaded.sha256, hashlib.sha256(data).hexdigest())
+
+    def test_same_content_is_saved_once(self):
+        admin = User.objects.create_superuser('admin@example.com', 'password')
+        self.client.force_login(admin)
+        data = self.image()
+        urls = [
+            self.client.post(reverse('ckeditor_upload'), {
+                'upload': SimpleUploadedFile(name, data, 'image/jpeg'),
+            }).json()['url']
+            for name in ('first.jpg', 'second.JPG')]
+
+        digest = hashlib.sha256(data).hexdigest()
+        name = 'uploads/{}/{}.jpg'.format(digest[:2], digest)
+        self.assertEqual(urls[0], urls[1])
+        self.assertTrue(urls[0].endswith('/' + name))
+        self.assertEqual(self.storage.listdir('uploads/' + digest[:2]), ([], [digest + '.jpg']))
+        # サムネイルは最初の1回だけ作る
+        self.executor.submit.assert_called_once_with(make_thumbnail, self.storage, name)
+        self.assertEqual(make_thumbnail(self.storage, name), 'uploads/{}/{}_thumb.jpg'.format(
+            digest[:2], digest))
+
+    def test_referenced_uploads(self):
+        contents = [
+            '<img src="/media/uploads/ab/one.jpg" alt="">',
+            '<a href=\'https://example.com/media/uploads/cd/two%20words.png?x=1\'>',
+            '&lt;img src=&quot;/media/uploads/ef/three.gif&quot;&gt;',
+            None,
+        ]
+        self.assertEqual(referenced_uploads(contents), {
+            'uploads/ab/one.jpg', 'uploads/cd/two words.png', 'uploads/ef/three.gif'})
+
+    def test_gc_keeps_referenced_and_recent_files(self):
+        referenced = self.save('uploads/ab/used.jpg', age_hours=48)
+        thumbnail = self.save('uploads/ab/used_thumb.jpg', age_hours=48)
+        recent = self.save('uploads/cd/recent.jpg', age_hours=1)
+        orphan = self.save('uploads/cd/orphan.jpg', age_hours=48)
+        user = User.objects.create_user('author@example.com', 'password')
+        Post.objects.create(
+            author=user, title='記事', content='<img src="/media/{}">'.format(referenced),
+            category=Category.objects.create(name='カテゴリ', name_en='category'))
+
+        out = StringIO()
+        call_command('gc_uploads', stdout=out)
+        self.assertIn(orphan, out.getvalue())
+        self.assertTrue(self.storage.exists(orphan))
+
+        call_command('gc_uploads', '--delete', stdout=StringIO())
+        self.assertFalse(self.storage.exists(orphan))
+        for name in (referenced, thumbnail, recent):
+            self.assertTrue(self.storage.exists(name), name)
@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# 同時に記録するURL名の数と、URL名ごとに残す応答時間の数
+MAX_VIEWS = 200
+MAX_SAMPLES = 500
+
+_current = ContextVar('blogapp_request_timings', default=None)
+
+
+def percentile(values, p):
+    """最近順位法によるパーセンタイル"""
+    values = sorted(values)
+    index = max(0, -(-len(values) * p // 100) - 1)
+    return values[int(index)]
+
+
+class RequestTimings:
+    """1リクエスト中の区間ごとの合計時間(ミリ秒)と回数"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.durations = {}
+        self.counts = {}
+
+    def add(self, name, seconds):
+        self.durations[name] = self.durations.get(name, 0) + seconds * 1000
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def total(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def activate(self):
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+
+def current_timings():
+    return _current.get()
+
+
+@contextmanager
+def timed(name):
+    """リクエスト中ならブロックの時間をnameとして記録する。StripeやSMTPの呼び出しに使う"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+
+def sql_timer(execute, sql, params, many, context):
+    """接続のexecute_wrapper。リクエスト中ならクエリの回数と時間を記録する"""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add('db', time.perf_counter() - start)
+
+
+def install_sql_timer(sender, connection, **kwargs):
+    """connection_createdシグナルで、新しい接続にsql_timerを付ける
+
+    ASGIではビューが別スレッドの接続を使うので、リクエストごとではなく接続ごとに付ける。
+    """
+    if sql_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(sql_timer)
+
+
+class TimingStats:
+    """URL名ごとの集計。ワーカーのメモリ内に持ち、件数に上限を付ける"""
+
+    def __init__(self, max_views=MAX_VIEWS, max_samples=MAX_SAMPLES):
+        self.max_views = max_views
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._views = OrderedDict()
+
+    def record(self, name, timings, total):
+        with self._lock:
+            entry = self._views.get(name)
+            if entry is None:
+                if len(self._views) >= self.max_views:
+                    # 一番長く使われていないURL名を捨てる
+                    self._views.popitem(last=False)
+                entry = self._views[name] = {
+                    'count': 0, 'durations': {}, 'queries': 0,
+                    'samples': deque(maxlen=self.max_samples),
+                }
+            else:
+                self._views.move_to_end(name)
+            entry['count'] += 1
+            entry['queries'] += timings.counts.get('db', 0)
+            entry['samples'].append(total)
+            for key, value in timings.durations.items():
+                entry['durations'][key] = entry['durations'].get(key, 0) + value
+
+    def summary(self):
+        """URL名ごとの平均と応答時間のパーセンタイル(ミリ秒)"""
+        with self._lock:
+            views = [(name, dict(entry, samples=list(entry['samples'])))
+                     for name, entry in self._views.items()]
+
+        rows = []
+        for name, entry in views:
+            count = entry['count']
+            samples = entry['samples']
+            rows.append({
+                'name': name,
+                'count': count,
+                'p50': percentile(samples, 50),
+                'p90': percentile(samples, 90),
+                'p99': percentile(samples, 99),
+                'queries': entry['queries'] / count,
+                'durations': {
+                    key: value / count
+                    for key, value in sorted(entry['durations'].items())},
+            })
+        rows.sort(key=lambda row: row['p90'] * row['count'], reverse=True)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._views.clear()
+
+
+stats = TimingStats()
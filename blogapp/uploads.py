@@ -0,0 +1,131 @@
+import hashlib
+import html
+import logging
+import os
+import re
+from io import BytesIO
+from urllib.parse import unquote
+
+from ckeditor_uploader.backends.pillow_backend import PillowBackend
+from ckeditor_uploader.utils import get_thumb_filename
+from django.conf import settings
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler, TemporaryFileUploadHandler,
+)
+from PIL import Image
+
+from .images import get_executor
+
+
+logger = logging.getLogger(__name__)
+
+
+def content_name(directory, digest, ext):
+    """内容のハッシュからファイル名を作る。同じディレクトリの同じ内容のファイルは同じ名前になる"""
+    return os.path.join(directory, digest[:2], '{}{}'.format(digest, ext.lower()))
+
+
+class HashingUploadHandlerMixin:
+    """アップロードを受け取りながらSHA-256を計算し、アップロードされたファイルのsha256に入れる"""
+
+    def new_file(self, *args, **kwargs):
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        # メモリに置かない大きなファイルは、次のハンドラが計算する
+        if getattr(self, 'activated', True):
+            self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        if uploaded is not None:
+            uploaded.sha256 = self.sha256.hexdigest()
+        return uploaded
+
+
+class HashingMemoryFileUploadHandler(HashingUploadHandlerMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(HashingUploadHandlerMixin, TemporaryFileUploadHandler):
+    pass
+
+
+def make_thumbnail(storage, name):
+    """CKEditorのファイルブラウザ用のサムネイルを作る"""
+    try:
+        with storage.open(name, 'rb') as f:
+            image = Image.open(f)
+            image.load()
+        image = image.convert('RGB')
+        image.thumbnail(getattr(settings, 'CKEDITOR_THUMBNAIL_SIZE', (75, 75)), Image.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, format='JPEG', optimize=True)
+        return storage.save(get_thumb_filename(name), buffer)
+    except Exception:
+        logger.exception('アップロード画像のサムネイルを作成できませんでした: %s', name)
+        return None
+
+
+class ContentAddressedBackend(PillowBackend):
+    """アップロードされたファイルを内容のハッシュ名で1度だけ保存するバックエンド
+
+    同じ画像を何度アップロードしても、ストレージには1つしか保存しない。
+    サムネイルはリクエストとは別のスレッドで作る。
+    """
+
+    def digest(self):
+        # 受け取るときにアップロードハンドラが計算したもの。無ければファイルを読んで計算する
+        digest = getattr(self.file_object, 'sha256', None)
+        if digest:
+            return digest
+        sha256 = hashlib.sha256()
+        self.file_object.seek(0)
+        for chunk in self.file_object.chunks():
+            sha256.update(chunk)
+        self.file_object.seek(0)
+        return sha256.hexdigest()
+
+    def save_as(self, filepath):
+        directory, filename = os.path.split(filepath)
+        _, ext = os.path.splitext(filename)
+        name = content_name(directory, self.digest(), ext)
+        if self.storage_engine.exists(name):
+            return name
+
+        is_image = self.is_image
+        is_animated = False
+        if is_image:
+            image = Image.open(self.file_object)
+            is_animated = getattr(image, 'is_animated', False)
+            self.file_object.seek(0)
+
+        saved_path = self.storage_engine.save(name, self.file_object)
+        if is_image and not is_animated:
+            get_executor().submit(make_thumbnail, self.storage_engine, saved_path)
+        return saved_path
+
+
+_UPLOAD_PATH = re.compile(
+    re.escape(settings.CKEDITOR_UPLOAD_PATH) + r'[^"\'\s<>()?#]+')
+
+
+def referenced_uploads(contents):
+    """記事本文から参照されているアップロードファイルの名前を集める"""
+    names = set()
+    for content in contents:
+        for match in _UPLOAD_PATH.findall(html.unescape(content or '')):
+            names.add(unquote(match))
+    return names
+
+
+def list_uploads(storage, path=None):
+    """ストレージ上のアップロードファイルを再帰的に列挙する"""
+    path = settings.CKEDITOR_UPLOAD_PATH.rstrip('/') if path is None else path
+    directories, files = storage.listdir(path)
+    for name in files:
+        yield '{}/{}'.format(path, name)
+    for directory in directories:
+        yield from list_uploads(storage, '{}/{}'.format(path, directory))
@@ -30,6 +30,7 @@ urlpatterns = [
     path('password_reset/complete/', views.PasswordResetComplete.as_view(),
          name='password_reset_complete'),
     path('like/<int:post_id>', views.Like_add, name='like_add'),
+    path('like_toggle/<int:post_id>', views.LikeToggle, name='like_toggle'),
     path('category_list', views.CategoryList.as_view(), name='category_list'),
     path('category_detail/<str:name_en>',
          views.CategoryDetail.as_view(), name='category_detail'),
@@ -38,6 +39,8 @@ urlpatterns = [
     path('contact_form', views.ContactFormView.as_view(), name='contact_form'),
     path('comment_form/<int:pk>',
          views.CommentFormView.as_view(), name='comment_form'),
+    path('comment_page/<int:pk>',
+         views.CommentPage, name='comment_page'),
     path('comment_delete/<int:pk>',
          views.CommentDelete.as_view(), name='comment_delete'),
     path('reply_form/<int:pk>', views.ReplyFormView.as_view(), name='reply_form'),
@@ -47,5 +50,7 @@ urlpatterns = [
     path('privacy', views.Privacy.as_view(), name='privacy'),
     path('service', views.Service.as_view(), name='service'),
     path('asked_question/', views.AskedQuestion.as_view(), name='asked_question'),
+    path('performance_stats/', views.PerformanceStats.as_view(), name='performance_stats'),
+    path('sales/', views.SalesDashboard.as_view(), name='sales_dashboard'),
     path('ckeditor/', include('ckeditor_uploader.urls')),
 ]
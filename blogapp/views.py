@@ -1,9 +1,10 @@
+import datetime
 import stripe
 from django.views.generic.edit import FormView
 from django.core.exceptions import ValidationError
 from django.core.paginator import Paginator
-from django.db.models import Q
-from django.http import HttpResponseBadRequest
+from django.db.models import Max
+from django.http import Http404, HttpResponseBadRequest
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth import login
@@ -14,7 +15,7 @@ from django.contrib.auth.views import (
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.shortcuts import render, resolve_url, redirect, get_object_or_404
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.mail import send_mail
 from django.core.signing import BadSignature, SignatureExpired, loads, dumps
@@ -22,15 +23,32 @@ from django.views.generic import TemplateView, CreateView, DetailView, UpdateVie
 from .models import Post, Like, Category, Comment, Reply, PriceHistory
 from django.urls import reverse_lazy
 from django.template.loader import render_to_string
+from django.template.response import TemplateResponse
 from django.contrib import messages
 from .forms import (PostForm, LoginForm, UserCreateForm, UserUpdateForm, MyPasswordChangeForm,
                     MyPasswordResetForm, MySetPasswordForm, SearchForm, ContactForm, CommentForm, ReplyForm)
 from .mixins import SuperuserRequiredMixin
+from .caches import (
+    category_latest_posts, category_summary, get_version, post_fragments_version,
+    stats as cache_stats,
+)
+from .comments import load_comment_page
+from .likes import toggle_like
+from .sales import sales_report
+from .conditional import ConditionalGetMixin
+from .pagination import KeysetPaginationMixin
+from .search import fetch_posts, search_post_ids
+from .mail import enqueue_mail
+from .timing import stats as timing_stats, timed
 from django.utils import timezone
+from django.utils.http import urlencode
+from django.views.decorators.http import require_POST
 
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
+SEARCH_PAGINATE_BY = 10
+
 User = get_user_model()
 
 
@@ -55,15 +73,26 @@ class OnlyMyReplyMixin(UserPassesTestMixin):
         reply=Reply.objects.get(id=self.kwargs['pk'])
         return reply.authority==self.request.user.email
 
-class Index(TemplateView):
+def _post_stamp(queryset):
+    # 記事の保存と削除はchanged_at('site')に記録されるので、件数は数えない
+    return (queryset.aggregate(last_updated=Max('updated_at'))['last_updated'],)
+
+
+class Index(ConditionalGetMixin, TemplateView):
     template_name = 'blogapp/index.html'
+    # 記事ごとにいいね数を出す
+    changed_scopes = ('site', 'post_list')
+
+    def get_last_updated(self):
+        return _post_stamp(Post.objects.all())
 
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(**kwargs)
+        posts = Post.objects.select_related('category')
         if Post.updated_at:
-            post_list = Post.objects.all().order_by('-updated_at')[:9]
+            post_list = posts.order_by('-updated_at', '-id')[:9]
         else:
-            post_list = Post.objects.all().order_by('-created_at')[:9]
+            post_list = posts.order_by('-created_at', '-id')[:9]
         context = {
             'post_list': post_list,
         }
@@ -84,33 +113,43 @@ class PostCreate(SuperuserRequiredMixin, CreateView):
         return resolve_url('blogapp:index')
 
 
-class PostDetail(DetailView):
+class PostDetail(ConditionalGetMixin, DetailView):
     model = Post
 
+    def get_queryset(self):
+        return Post.objects.select_related('category', 'author')
+
+    def get_last_updated(self):
+        # 記事が無ければ条件付きGETをせず、そのまま404にする
+        return Post.objects.filter(pk=self.kwargs['pk']).values_list(
+            'updated_at', 'category_id').first()
+
+    def get_changed_scopes(self):
+        # コメントや購入はその記事のページだけを変える
+        return ('site', 'post:{}'.format(self.kwargs['pk']))
+
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(**kwargs)
         context['publick_key'] = settings.STRIPE_PUBLIC_KEY
-        detail_data = Post.objects.get(id=self.kwargs['pk'])
-        category_posts = Post.objects.filter(
-            category=detail_data.category).order_by('-created_at')[:5]
-        params = {
-            'object': detail_data,
-            'category_posts': category_posts,
-            'context': context,
-        }
-        return params
+        context['category_posts'] = category_latest_posts(self.object.category_id)
+        context['comment_page'] = load_comment_page(self.object)
+        context['fragment_timeout'] = settings.FRAGMENT_CACHE_TIMEOUT
+        context['fragment_version'] = post_fragments_version(self.object.pk)
+        context['sidebar_version'] = get_version('post_sidebar')
+        return context
 
     def post(self, request, *args, **kwargs):
-        post = self.get_object()
+        post = self.object = self.get_object()
         token = request.POST['stripeToken']
         try:
-            charge = stripe.Charge.create(
-                amount=post.price,
-                currency='jpy',
-                source=token,
-                description='メール：{} メンター名：{}'.format(
-                    request.user.email, post.title),
-            )
+            with timed('stripe'):
+                charge = stripe.Charge.create(
+                    amount=post.price,
+                    currency='jpy',
+                    source=token,
+                    description='メール：{} メンター名：{}'.format(
+                        request.user.email, post.title),
+                )
             messages.info(self.request, 'お支払い完了しました')
         except stripe.error.CardError as e:
             context = self.get_context_data()
@@ -118,7 +157,8 @@ class PostDetail(DetailView):
             return render(request, 'blogapp/post_detail.html', context)
         else:
             PriceHistory.objects.create(
-                post=post, user=request.user, stripe_id=charge.id)
+                post=post, user=request.user, stripe_id=charge.id,
+                amount=post.price, category_id=post.category_id)
             return redirect('blogapp:index')
 
 
@@ -139,15 +179,14 @@ class PostDelete(SuperuserRequiredMixin, DeleteView):
         return resolve_url('blogapp:index')
 
 
-class PostList(ListView):
+class PostList(ConditionalGetMixin, KeysetPaginationMixin, ListView):
     model = Post
     paginate_by = 5
+    keyset_ordering = ('-updated_at', '-id')
+    changed_scopes = ('site', 'post_list')
 
-    def get_queryset(self):
-        if Post.updated_at:
-            return Post.objects.all().order_by('-updated_at')
-        else:
-            return Post.objects.all().order_by('-created_at')
+    def get_last_updated(self):
+        return _post_stamp(Post.objects.all())
 
 
 class Login(LoginView):
@@ -187,7 +226,7 @@ class UserCreate(CreateView):
         message = render_to_string(
             'blogapp/mail_template/create/message.txt', context)
 
-        user.email_user(subject, message)
+        enqueue_mail(subject, message, recipient_list=[user.email])
         return redirect('blogapp:user_create_done')
 
 
@@ -298,72 +337,95 @@ class PasswordResetComplete(PasswordResetCompleteView):
 
 @login_required
 def Like_add(request, *args, **kwargs):
-    post = Post.objects.get(id=kwargs['post_id'])
-    is_liked = Like.objects.filter(user=request.user, post=post).count()
-    if is_liked > 0:
-        liking = Like.objects.get(
-            post_id=kwargs['post_id'], user=request.user)
-        liking.delete()
-        post.like_num -= 1
-        # post.save()
+    """JavaScriptが使えないとき用。付け外しの後、トップページに戻る"""
+    try:
+        liked, _ = toggle_like(request.user, kwargs['post_id'])
+    except Post.DoesNotExist:
+        raise Http404
+    if liked:
+        messages.success(request, 'お気に入りに追加しました。')
+    else:
         messages.info(request, 'お気に入りを削除しました。')
-        return redirect('blogapp:index')
-    post.like_num += 1
-    # post.save()
-    like = Like()
-    like.user = request.user
-    like.post = post
-    like.save()
-
-    messages.success(request, 'お気に入りに追加しました。')
     return redirect('blogapp:index')
 
 
+@require_POST
+def LikeToggle(request, post_id):
+    """いいねを付け外しし、新しい状態といいね数をJSONで返す"""
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'login required'}, status=401)
+    try:
+        liked, like_num = toggle_like(request.user, post_id)
+    except Post.DoesNotExist:
+        return JsonResponse({'error': 'not found'}, status=404)
+    return JsonResponse({'liked': liked, 'like_num': like_num})
+
+
 class CategoryList(ListView):
     model = Category
+    template_name = 'blogapp/category_list.html'
+    context_object_name = 'category_list'
+
+    def get_queryset(self):
+        return category_summary()
 
 
-class CategoryDetail(DetailView):
+class CategoryDetail(ConditionalGetMixin, KeysetPaginationMixin, DetailView):
     model = Category
     slug_field = 'name_en'
     slug_url_kwarg = 'name_en'
+    paginate_by = 10
+    keyset_ordering = ('-created_at', '-id')
+    changed_scopes = ('site', 'post_list')
+
+    def get_last_updated(self):
+        return _post_stamp(
+            Post.objects.filter(category__name_en=self.kwargs['name_en']))
 
     def get_context_data(self, *args, **kwargs):
-        detail_data = Category.objects.get(name_en=self.kwargs['name_en'])
-        category_posts = Post.objects.filter(
-            category=detail_data.id).order_by('-created_at')
+        page = self.paginate_keyset(
+            Post.objects.filter(category=self.object), self.paginate_by)
 
         params = {
-            'object': detail_data,
-            'category_posts': category_posts,
+            'object': self.object,
+            'category_posts': page.object_list,
+            'page_obj': page,
         }
 
         return params
 
 
 def Search(request):
-    if request.method == 'POST':
-        searchform = SearchForm(request.POST)
+    searchform = SearchForm(request.POST if request.method == 'POST' else request.GET)
+    freeword = ''
+    if searchform.is_valid():
+        freeword = searchform.cleaned_data['freeword']
 
-        if searchform.is_valid():
-            freeword = searchform.cleaned_data['freeword']
-            search_list = Post.objects.filter(
-                Q(title__icontains=freeword) | Q(content__icontains=freeword))
+    search_list = []
+    page_obj = None
+    if freeword:
+        paginator = Paginator(search_post_ids(freeword), SEARCH_PAGINATE_BY)
+        page_obj = paginator.get_page(request.GET.get('page'))
+        search_list = fetch_posts(page_obj.object_list)
 
-        params = {
-            'search_list': search_list,
-        }
+    params = {
+        'search_list': search_list,
+        'page_obj': page_obj,
+        'freeword': freeword,
+        'query_string': urlencode({'freeword': freeword}) + '&',
+    }
 
-        return render(request, 'blogapp/search.html', params)
+    return TemplateResponse(request, 'blogapp/search.html', params)
 
 
-class LikeDetail(ListView):
+class LikeDetail(KeysetPaginationMixin, ListView):
     model = Like
 
     paginate_by = 5
+    keyset_ordering = ('-id',)
 
     def get_queryset(self):
-        return Like.objects.filter(user=self.request.user)
+        return Like.objects.filter(user=self.request.user).select_related('post')
 
 
 class ContactFormView(FormView):
@@ -404,6 +466,18 @@ class CommentFormView(LoginRequiredMixin, CreateView):
         return context
 
 
+def CommentPage(request, pk):
+    """古いコメントを追加で読み込むためのJSON"""
+    post = get_object_or_404(Post, pk=pk)
+    page = load_comment_page(post, cursor=request.GET.get('cursor'))
+    html = render_to_string(
+        'blogapp/comment_items.html', {'comment_page': page}, request)
+    return JsonResponse({
+        'html': html,
+        'next_cursor': page.next_cursor,
+    })
+
+
 class CommentDelete(OnlyMyCommentMixin, DeleteView):
     model = Comment
 
@@ -464,3 +538,38 @@ class AskedQuestion(TemplateView):
     template_name = 'blogapp/asked_question.html'
 
 
+class PerformanceStats(SuperuserRequiredMixin, TemplateView):
+    """このワーカーで集計した、URL名ごとの応答時間とキャッシュのヒット数"""
+    template_name = 'blogapp/performance_stats.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['stats'] = timing_stats.summary()
+        context['cache_stats'] = sorted(cache_stats.items())
+        return context
+
+
+class SalesDashboard(SuperuserRequiredMixin, TemplateView):
+    """日ごとの売上集計表から作る売上レポート"""
+    template_name = 'blogapp/sales_dashboard.html'
+    day_choices = (7, 30, 90, 365)
+
+    def get_days(self):
+        try:
+            days = int(self.request.GET.get('days', 30))
+        except ValueError:
+            days = 30
+        return min(max(days, 1), 366)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        days = self.get_days()
+        until = timezone.localdate() + datetime.timedelta(days=1)
+        since = until - datetime.timedelta(days=days)
+        context['days'] = days
+        context['day_choices'] = self.day_choices
+        context['since'] = since
+        context['report'] = sales_report(since, until)
+        return context
+
+
@@ -0,0 +1,70 @@
+"""
+gunicornの設定
+
+Procfileから `gunicorn -c gunicorn.conf.py project.wsgi` で読み込む。
+ワーカー数などは環境変数で変えられる。
+
+ASGIで動かすときは、requirements-asgi.txtを入れてuvicornのワーカーを使う。
+    GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker \
+        gunicorn -c gunicorn.conf.py project.asgi:application
+"""
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+bind = '0.0.0.0:{}'.format(os.environ.get('PORT', '8000'))
+
+# 既定のキャッシュがプロセスごと(LocMemCache)だと、世代番号などの無効化が他のワーカーに
+# 伝わらず古いページを返してしまうので、そのときは1ワーカーにする。
+# レンダリング済みHTML(fragments)はキーに世代番号が入るので、プロセスごとでよい
+per_process_cache = 'locmem' in os.environ.get('CACHE_BACKEND', '').lower()
+
+# ワーカー数はCPU数から決める(Herokuでは WEB_CONCURRENCY が設定される)
+if per_process_cache:
+    workers = 1
+else:
+    workers = _env_int('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1)
+# StripeやSMTPの待ち時間で他のリクエストが止まらないよう、スレッドも使う
+threads = _env_int('GUNICORN_THREADS', 4)
+worker_class = os.environ.get(
+    'GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+
+# アプリを親プロセスで読み込み、forkしたワーカーとメモリを共有する
+preload_app = True
+
+# メモリの増加を抑えるため、一定数のリクエストでワーカーを入れ替える。
+# 全ワーカーが同時に再起動しないよう、ばらつきを持たせる
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10)
+
+timeout = _env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+# ハートビートのファイルをディスクではなくメモリに置く
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    if per_process_cache:
+        server.log.warning('LocMemCache is per-process; running a single worker.')
+
+
+def pre_fork(server, worker):
+    # 親プロセスのDB接続をワーカーに引き継がない
+    from django.db import connections
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    from project.warmup import warm_up
+    warm_up()
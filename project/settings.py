@@ -52,6 +52,7 @@ INSTALLED_APPS = [
 SITE_ID = 1
 
 MIDDLEWARE = [
+    'blogapp.middleware.ServerTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -64,6 +65,10 @@ MIDDLEWARE = [
     'social_django.middleware.SocialAuthExceptionMiddleware',
 ]
 
+# Server-TimingヘッダーはDBのクエリ数なども含むので、既定ではスタッフにだけ返す
+# (集計はすべてのリクエストで行う)。1にすると誰にでも返す
+SERVER_TIMING_PUBLIC = os.environ.get('SERVER_TIMING_PUBLIC') == '1'
+
 ROOT_URLCONF = 'project.urls'
 
 TEMPLATES = [
@@ -79,6 +84,7 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 'django.template.context_processors.media',
                 'blogapp.context_processors.all_category',
+                'sitemanage.context_processors.site_config',
                 'social_django.context_processors.backends',
                 'social_django.context_processors.login_redirect',
             ],
@@ -138,11 +144,20 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 
-# 仮想環境のみ
-# STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
-# STATICFILES_DIRS = (
-#     os.path.join(BASE_DIR, 'static'),
-# )
+# static/には自前のファイルだけを置く。adminやCKEditorはパッケージから集める
+STATICFILES_DIRS = (
+    os.path.join(BASE_DIR, 'static'),
+)
+
+# 使わないCKEditorのプラグインや言語ファイルはcollectstaticで集めない
+STATICFILES_FINDERS = [
+    'blogapp.staticfiles.PrunedFileSystemFinder',
+    'blogapp.staticfiles.PrunedAppDirectoriesFinder',
+]
+
+# collectstaticでハッシュ付きのファイル名と.gz/.brを書き出す。
+# ハッシュ付きのファイルはWhiteNoiseがimmutableで長期間キャッシュさせる
+STATICFILES_STORAGE = 'blogapp.staticfiles.CompressedManifestStorage'
 
 AUTHENTICATION_BACKENDS = (
     'social_core.backends.open_id.OpenIdAuth',
@@ -162,14 +177,65 @@ LOGIN_URL = 'blogapp:login'
 LOGIN_REDIRECT_URL = 'blogapp:index'
 
 
+# キャッシュ。既定では各ワーカーのメモリ(L1)とDBのテーブル(L2、migrateで作られる)の2段にする。
+# ヒットはメモリから返し、無効化はL2を通してCACHE_LOCAL_TIMEOUT秒のうちに他のワーカーに伝わる。
+# memcachedなどはCACHE_BACKENDとCACHE_LOCATIONで指定する。
+# LocMemCacheだけにするとプロセスごとになるので、gunicornは1ワーカーで動かす
+CACHE_TIMEOUT = int(os.environ.get('CACHE_TIMEOUT', 60 * 60))
+CACHE_LOCAL_TIMEOUT = int(os.environ.get('CACHE_LOCAL_TIMEOUT', 5))
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'blogapp.cache_backends.TwoLevelCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'shared'),
+        'TIMEOUT': CACHE_TIMEOUT,
+        'LOCAL_TIMEOUT': CACHE_LOCAL_TIMEOUT,
+    },
+    # TwoLevelCacheのL2
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'blogapp_cache',
+        'TIMEOUT': CACHE_TIMEOUT,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 10000)),
+        },
+    },
+    # 記事本文などのレンダリング済みHTML。キーに共有キャッシュの世代番号が入り、
+    # 無効化はキーが変わることで伝わるので、各ワーカーのメモリに置く
+    'fragments': {
+        'BACKEND': os.environ.get(
+            'FRAGMENT_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('FRAGMENT_CACHE_LOCATION', 'fragments'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('FRAGMENT_CACHE_MAX_ENTRIES', 500)),
+        },
+    },
+}
+
+FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 MEDIA_URL = '/media/'
 
+# サムネイルの縮小版
+THUMBNAIL_WIDTHS = (320, 640, 960)
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_WORKERS = int(os.environ.get('THUMBNAIL_WORKERS', 2))
+
 CKEDITOR_UPLOAD_PATH = 'uploads/'
 
 X_FRAME_OPTIONS = 'SAMEORIGIN'
 
-CKEDITOR_IMAGE_BACKEND = "pillow"
+CKEDITOR_IMAGE_BACKEND = "content_addressed"
+# 同じ内容のアップロードを1つにまとめるので、日付ごとのディレクトリには分けない
+CKEDITOR_RESTRICT_BY_DATE = False
+
+# アップロードを受け取りながら内容のハッシュを計算する(CKEditorのアップロードの重複除去に使う)
+FILE_UPLOAD_HANDLERS = [
+    'blogapp.uploads.HashingMemoryFileUploadHandler',
+    'blogapp.uploads.HashingTemporaryFileUploadHandler',
+]
 
 # Gmail で送信する場合
 EMAIL_HOST = 'smtp.gmail.com'
@@ -239,11 +305,8 @@ SECURE_PROXY_SSL_HEADER = ('HTTP_X_FOWARDED_PROTO', 'https')
 
 ALLOWED_HOSTS = ['*']
 
-# 開発環境のみ
-# STATICFILES_DIRS = (os.path.join(BASE_DIR, 'static'),)
-
-# 本番環境でコメントを外す
-STATIC_ROOT = os.path.join(BASE_DIR, 'static')
+# collectstaticの出力先
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
 DEBUG = False
 
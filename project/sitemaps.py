@@ -1,9 +1,20 @@
+import hashlib
+from functools import wraps
+
 from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps import views as sitemap_views
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.urls import reverse
+from django.views.decorators.http import condition
 
+from blogapp.caches import changed_at, get_version
 from blogapp.models import Post
 
 
+SITEMAP_CACHE_TIMEOUT = 60 * 60 * 24
+
+
 class BlogPostSitemap(Sitemap):
     """
     ブログ記事のサイトマップ
@@ -13,7 +24,8 @@ class BlogPostSitemap(Sitemap):
     protocol = "https"
 
     def items(self):
-        return Post.objects.all()
+        # URLと更新日時しか使わないので、本文は読み込まない
+        return Post.objects.only('pk', 'updated_at', 'created_at').order_by('pk')
 
     # モデルに get_absolute_url() が定義されている場合は不要
     def location(self, obj):
@@ -39,3 +51,53 @@ class StaticViewSitemap(Sitemap):
 
     def location(self, item):
         return reverse(item)
+
+
+def sitemap_last_modified(request, *args, **kwargs):
+    """記事の保存・削除で記録する日時。ETagの世代番号と同時に変わる"""
+    return changed_at('sitemap')
+
+
+def sitemap_etag(request, *args, **kwargs):
+    """記事の保存・削除で変わる世代番号から作る。DBは読まない"""
+    value = '{}:{}'.format(get_version('sitemap'), request.get_full_path())
+    return hashlib.md5(value.encode()).hexdigest()
+
+
+def cached_sitemap(view):
+    """サイトマップのビューにキャッシュと条件付きGET(304)を付ける
+
+    キャッシュのキーには記事の保存・削除で変わる世代番号を含める。
+    """
+    @wraps(view)
+    @condition(etag_func=sitemap_etag, last_modified_func=sitemap_last_modified)
+    def wrapped(request, *args, **kwargs):
+        key = 'sitemap:{}:{}'.format(get_version('sitemap'), sitemap_etag(request))
+        cached = cache.get(key)
+        if cached is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            response.render()
+            cached = (response.content, response['Content-Type'])
+            cache.set(key, cached, SITEMAP_CACHE_TIMEOUT)
+
+        response = HttpResponse(cached[0], content_type=cached[1])
+        response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+        return response
+    return wrapped
+
+
+@cached_sitemap
+def sitemap_root(request, sitemaps):
+    """1ファイルに収まる間は通常のサイトマップ、超えたらサイトマップインデックスを返す"""
+    for site in sitemaps.values():
+        if callable(site):
+            site = site()
+        if site.paginator.num_pages > 1:
+            return sitemap_views.index(
+                request, sitemaps, sitemap_url_name='sitemap_section')
+    return sitemap_views.sitemap(request, sitemaps)
+
+
+sitemap_section = cached_sitemap(sitemap_views.sitemap)
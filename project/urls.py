@@ -2,10 +2,11 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf.urls.static import static
 from django.conf import settings
-from django.contrib.sitemaps.views import sitemap
 from .sitemaps import (
     BlogPostSitemap,
     StaticViewSitemap,
+    sitemap_root,
+    sitemap_section,
 )
 
 sitemaps = {
@@ -18,7 +19,9 @@ urlpatterns = [
     path('', include('blogapp.urls')),
     path('oauth/', include('social_django.urls', namespace='social')),
     path('ckeditor/', include('ckeditor_uploader.urls')),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='sitemap'),
+    path('sitemap.xml', sitemap_root, {'sitemaps': sitemaps}, name='sitemap'),
+    path('sitemap-<section>.xml', sitemap_section, {'sitemaps': sitemaps},
+         name='sitemap_section'),
 ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 if settings.DEBUG:
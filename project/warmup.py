@@ -0,0 +1,96 @@
+"""
+ワーカーの起動直後に、最初のリクエストが払う費用を先に払っておく
+
+gunicorn.conf.py のフックから呼ぶ。
+"""
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.template import TemplateSyntaxError, engines
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def import_views():
+    """URLconfを読み込み、すべてのビューのモジュールをimportする"""
+    resolver = get_resolver()
+    resolver.url_patterns
+    # 逆引きの表も最初のreverse()で作られるので先に作る
+    resolver.reverse_dict
+
+
+def project_template_names():
+    """このプロジェクトのテンプレート名。Djangoやライブラリのテンプレートは含めない"""
+    engine = engines['django'].engine
+    loaders = []
+    for loader in engine.template_loaders:
+        # 本番(DEBUG=False)ではキャッシュ付きのローダーに包まれている
+        loaders.extend(getattr(loader, 'loaders', [loader]))
+    for loader in loaders:
+        if not hasattr(loader, 'get_dirs'):
+            continue
+        for directory in loader.get_dirs():
+            directory = str(directory)
+            if not directory.startswith(settings.BASE_DIR):
+                continue
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    yield os.path.relpath(os.path.join(root, name), directory)
+
+
+def compile_templates():
+    """キャッシュ付きのローダーにコンパイル済みのテンプレートを載せる"""
+    engine = engines['django']
+    count = 0
+    for name in project_template_names():
+        try:
+            engine.get_template(name.replace(os.sep, '/'))
+        except TemplateSyntaxError:
+            logger.exception('Could not compile template %s', name)
+        else:
+            count += 1
+    return count
+
+
+def prime_caches():
+    """全ページで使うキャッシュと、プロセス内のメモを読み込んでおく"""
+    from blogapp.caches import category_summary, nav_categories
+    from sitemanage.caches import get_site_config
+
+    nav_categories()
+    category_summary()
+    get_site_config()
+
+
+def prime_storage():
+    """サムネイルのURLを作るストレージ(本番はS3)のクライアントと、静的ファイルのmanifestを読み込んでおく"""
+    from django.contrib.staticfiles.storage import staticfiles_storage
+    from django.core.files.storage import default_storage
+
+    default_storage.url('images/warmup.jpg')
+    staticfiles_storage.url('css/style.css')
+
+
+def warm_up():
+    start = time.perf_counter()
+    import_views()
+    templates = compile_templates()
+    try:
+        prime_storage()
+    except Exception:
+        # manifestにないファイルがあったり、S3に繋がらなくても、ワーカーは起動させる
+        logger.exception('Could not prime storage')
+    try:
+        prime_caches()
+    except Exception:
+        # DBやキャッシュに繋がらなくても、ワーカーは起動させる
+        logger.exception('Could not prime caches')
+    finally:
+        # fork後のワーカーのスレッドごとに接続を作り直させる
+        connections.close_all()
+    logger.info('Warmed up %d templates in %.1fms',
+                templates, (time.perf_counter() - start) * 1000)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class SitemanageConfig(AppConfig):
     name = 'sitemanage'
+
+    def ready(self):
+        from . import signals
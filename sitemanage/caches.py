@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+
+from blogapp.caches import bump_version, memoize
+
+from .models import SiteConfig
+
+
+VERSION_NAME = 'siteconfig'
+
+def clear_site_config():
+    """すべてのワーカーのサイト設定のメモを無効にする"""
+    bump_version(VERSION_NAME)
+
+
+def _load_site_config(site_id, version):
+    key = 'sitemanage:siteconfig:{}:{}'.format(site_id, version)
+    cached = cache.get(key)
+    if cached is None:
+        # 設定が無いこともキャッシュするため、タプルで包む
+        cached = (SiteConfig.objects.filter(site_id=site_id).first(),)
+        cache.set(key, cached)
+    return cached[0]
+
+
+def get_site_config(site_id=None):
+    """サイト設定を返す。プロセス内のメモから返し、共有キャッシュで使い回す
+
+    他のワーカーでSiteConfigやSiteが保存されると世代番号が変わり、数秒のうちに読み直す。
+    """
+    site_id = site_id or settings.SITE_ID
+    return memoize(
+        'siteconfig:{}'.format(site_id), VERSION_NAME,
+        lambda version: _load_site_config(site_id, version),
+        # CurrentSiteMiddlewareが使うSiteのキャッシュも古くなっている
+        on_change=Site.objects.clear_cache)
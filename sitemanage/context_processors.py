@@ -0,0 +1,12 @@
+from django.utils.functional import SimpleLazyObject
+
+from .caches import get_site_config
+
+
+def site_config(request):
+    # サイト設定を表示しないページでは取得しない
+    params = {
+        'siteconfig': SimpleLazyObject(get_site_config),
+    }
+
+    return params
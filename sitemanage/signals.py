@@ -0,0 +1,15 @@
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .caches import clear_site_config
+from .models import SiteConfig
+
+
+@receiver(post_save, sender=SiteConfig)
+@receiver(post_delete, sender=SiteConfig)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def clear_site_config_cache(sender, instance, **kwargs):
+    """全ワーカーのサイト設定のキャッシュを無効にする"""
+    clear_site_config()
@@ -1,3 +1,51 @@
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache, caches
 from django.test import TestCase
 
-# Create your tests here.
+from blogapp import caches as blog_caches
+
+from .context_processors import site_config
+from .caches import get_site_config
+from .models import SiteConfig
+
+
+class SiteConfigCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        blog_caches._memo.clear()
+        self.config = SiteConfig.objects.create(
+            site=Site.objects.get_current(), meta_title='before', meta_description='',
+            meta_keywords='', author='', top_title='', top_subtitle='')
+
+    def test_memo_costs_no_queries(self):
+        self.assertEqual(get_site_config().meta_title, 'before')
+        with self.assertNumQueries(0):
+            self.assertEqual(get_site_config().meta_title, 'before')
+
+    def test_context_processor_is_lazy(self):
+        with self.assertNumQueries(0):
+            context = site_config(None)
+        self.assertEqual(context['siteconfig'].meta_title, 'before')
+
+    def test_changes_from_other_workers(self):
+        get_site_config()
+        # 他のワーカーでの保存は、共有キャッシュの世代番号の変化として伝わる
+        SiteConfig.objects.filter(pk=self.config.pk).update(meta_title='after')
+        caches['shared'].incr('blogapp:version:siteconfig')
+        self.assertEqual(get_site_config().meta_title, 'before')
+
+        later = settings.CACHE_LOCAL_TIMEOUT + 1
+        with mock.patch.object(blog_caches.time, 'monotonic', return_value=time.monotonic() + later), \
+                mock.patch('django.core.cache.backends.locmem.time.time', return_value=time.time() + later):
+            self.assertEqual(get_site_config().meta_title, 'after')
+
+    def test_changes_in_this_worker(self):
+        get_site_config()
+        self.config.meta_title = 'after'
+        self.config.save()
+        self.assertEqual(get_site_config().meta_title, 'after')
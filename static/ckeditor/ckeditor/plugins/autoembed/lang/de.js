@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","de",{embeddingInProgress:"Einbetten der eingefügten URL wird versucht...",embeddingFailed:"Diese URL konnte nicht automatisch eingebettet werden."});
\ No newline at end of file
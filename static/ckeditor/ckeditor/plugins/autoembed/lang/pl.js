@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","pl",{embeddingInProgress:"Osadzanie wklejonego adresu URL...",embeddingFailed:"Ten adres URL multimediów nie może być automatycznie osadzony."});
\ No newline at end of file
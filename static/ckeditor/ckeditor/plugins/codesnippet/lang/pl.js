@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("codesnippet","pl",{button:"Wstaw fragment kodu",codeContents:"Treść kodu",emptySnippetError:"Kod nie może być pusty.",language:"Język",title:"Fragment kodu",pathName:"fragment kodu"});
\ No newline at end of file
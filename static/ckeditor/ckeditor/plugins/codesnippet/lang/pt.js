@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("codesnippet","pt",{button:"Inserir fragmento de código",codeContents:"Code content",emptySnippetError:"A code snippet cannot be empty.",language:"Idioma",title:"Code snippet",pathName:"Fragmento de código"});
\ No newline at end of file
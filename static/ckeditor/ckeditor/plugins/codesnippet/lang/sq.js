@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("codesnippet","sq",{button:"Shto kod copëze",codeContents:"Përmbajtja e kodit",emptySnippetError:"A code snippet cannot be empty.",language:"Gjuha",title:"Code snippet",pathName:"code snippet"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("image2","ku",{alt:"جێگرەوەی دەق",btnUpload:"ناردنی بۆ ڕاژه",captioned:"وێنەی بەسەردێر",captionPlaceholder:"سەردێر",infoTab:"زانیاری وێنه",lockRatio:"داخستنی ڕێژه",menu:"خاسیەتی وێنه",pathName:"وێنە",pathNameCaption:"سەردێر",resetSize:"ڕێکخستنەوەی قەباره",resizer:"کرتەبکە و ڕایبکێشە بۆ قەبارە گۆڕین",title:"خاسیەتی وێنه",uploadTab:"بارکردن",urlMissing:"سەرچاوەی بەستەری وێنه بزره"});
\ No newline at end of file
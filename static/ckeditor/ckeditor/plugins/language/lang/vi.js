@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("language","vi",{button:"Thiết lập ngôn ngữ",remove:"Loại bỏ ngôn ngữ"});
\ No newline at end of file
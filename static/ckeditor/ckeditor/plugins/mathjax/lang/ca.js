@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","ca",{title:"Matemàtiques a TeX",button:"Matemàtiques",dialogInput:"Escriu el TeX aquí",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"Documentació TeX",loading:"carregant...",pathName:"matemàtiques"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","fr",{title:"Mathématiques au format TeX",button:"Math",dialogInput:"Saisir la formule TeX ici",docUrl:"http://fr.wikibooks.org/wiki/LaTeX/Math%C3%A9matiques",docLabel:"Documentation du format TeX",loading:"chargement...",pathName:"math"});
\ No newline at end of file
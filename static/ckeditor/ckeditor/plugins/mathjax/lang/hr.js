@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","hr",{title:"Matematika u TeXu",button:"Matematika",dialogInput:"Napiši svoj TeX ovdje",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX dokumentacija",loading:"učitavanje...",pathName:"matematika"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","hu",{title:"Matematika a TeX-ben",button:"Matek",dialogInput:"Írd a TeX-ed ide",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX dokumentáció",loading:"töltés...",pathName:"matek"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","no",{title:"Matematikk i TeX",button:"Matte",dialogInput:"Skriv TeX-koden her",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX-dokumentasjon",loading:"laster...",pathName:"matte"});
\ No newline at end of file
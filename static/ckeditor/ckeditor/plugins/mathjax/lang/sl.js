@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("mathjax","sl",{title:"Matematika v TeX",button:"Matematika",dialogInput:"Napišite svoj TeX tukaj",docUrl:"http://en.wikibooks.org/wiki/LaTeX/Mathematics",docLabel:"TeX dokumentacija",loading:"nalaganje...",pathName:"matematika"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","af",{toolbar:"Bron",title:"Bron"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","bg",{toolbar:"Източник",title:"Източник"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","bs",{toolbar:"HTML kôd",title:"HTML kôd"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ca",{toolbar:"Codi font",title:"Codi font"});
\ No newline at end of file
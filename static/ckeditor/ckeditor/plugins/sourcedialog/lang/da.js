@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","da",{toolbar:"Kilde",title:"Kilde"});
\ No newline at end of file
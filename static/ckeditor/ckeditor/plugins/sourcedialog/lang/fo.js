@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","fo",{toolbar:"Kelda",title:"Kelda"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","fr-ca",{toolbar:"Source",title:"Source"});
\ No newline at end of file
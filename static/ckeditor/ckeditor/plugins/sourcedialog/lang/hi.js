@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","hi",{toolbar:"सोर्स",title:"सोर्स"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ja",{toolbar:"ソース",title:"ソース"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","mn",{toolbar:"Код",title:"Код"});
\ No newline at end of file
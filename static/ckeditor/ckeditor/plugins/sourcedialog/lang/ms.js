@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ms",{toolbar:"Sumber",title:"Sumber"});
\ No newline at end of file
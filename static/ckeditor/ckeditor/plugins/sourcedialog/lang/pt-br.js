@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","pt-br",{toolbar:"Código-Fonte",title:"Código-Fonte"});
\ No newline at end of file
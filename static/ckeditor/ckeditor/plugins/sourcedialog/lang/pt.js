@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","pt",{toolbar:"Fonte",title:"Fonte"});
\ No newline at end of file
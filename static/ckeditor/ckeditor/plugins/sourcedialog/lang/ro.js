@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ro",{toolbar:"Sursa",title:"Sursa"});
\ No newline at end of file
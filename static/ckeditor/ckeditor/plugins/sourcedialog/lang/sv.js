@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","sv",{toolbar:"Källa",title:"Källa"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","vi",{toolbar:"Mã HTML",title:"Mã HTML"});
\ No newline at end of file
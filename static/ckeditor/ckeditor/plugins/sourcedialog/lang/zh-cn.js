@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","zh-cn",{toolbar:"源码",title:"源码"});
\ No newline at end of file
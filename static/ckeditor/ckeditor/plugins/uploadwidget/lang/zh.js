@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uploadwidget","zh",{abort:"上傳由使用者放棄。",doneOne:"檔案成功上傳。",doneMany:"成功上傳 %1 檔案。",uploadOne:"正在上傳檔案（{percentage}%）...",uploadMany:"正在上傳檔案，{max} 中的 {current} 已完成（{percentage}%）..."});
\ No newline at end of file